@@ -8,18 +8,25 @@
 #
 #
 #
-import argparse
-import random
+import os
 import sys
 import time
+import types
 import threading
 import queue
 import collections
+import contextlib
+import functools
 import logging
 import re
-from abc import ABC, abstractmethod, abstractproperty
+import struct
+import socket
+import operator
+from abc import ABC, abstractmethod
 import importlib
 
+__version__ = "0.410"
+
 #
 # Nevoton module (FW1.3) docs https://nevoton.ru/docs/instructions/OpenTherm_Modbus_BCG-1.0.2-W.pdf
 # Opentherm protocol v2.2 https://ihormelnyk.com/Content/Pages/opentherm_library/Opentherm%20Protocol%20v2-2.pdf
@@ -51,6 +58,17 @@ OT_WRITE_ACK=5
 OT_DATA_INVALID=6
 OT_UNKNOWN_DATA_ID=7
 
+# Message type names (indexed by message type)
+OT_MSGS = (
+    "READ-DATA",        # OT_READ_DATA
+    "WRITE-DATA",       # OT_WRITE_DATA
+    "INVALID-DATA",     # OT_INVALID_DATA
+    "OT-RESERVED",      # OT_RESERVED
+    "READ-ACK",         # OT_READ_ACK
+    "WRITE-ACK",        # OT_WRITE_ACK
+    "DATA-INVALID",     # OT_DATA_INVALID
+    "UNKNOWN-DATAID")   # OT_UNKNOWN_DATA_ID
+
 # mqtt connect timeout
 MQTT_CONN_TIMEOUT=10
 
@@ -84,6 +102,12 @@ NCTL_DATA_NEW="/controls/Data Type"
 NCTL_COMMAND_OLD="/controls/TR Command"
 NCTL_ID_OLD="/controls/TR ID"
 NCTL_DATA_OLD="/controls/TR Data"
+#
+# kinds of replies (by transparent control topic they arrived on)
+NCTL_KIND_UNKNOWN=0
+NCTL_KIND_COMMAND=1
+NCTL_KIND_ID=2
+NCTL_KIND_DATA=3
 
 # Nevoton's driver should reply over mqtt in specified number of seconds
 MQTT_ReplyTimeout=3
@@ -93,13 +117,98 @@ MQTT_ResponseTimeout=60
 MQTT_PartResponseTimeout=30
 # Nevoton's module should provide opentherm slave device response in specified number of seconds
 Modbus_ResponseTimeout=20
+# Single modbus frame timeout (RTU framer returns as soon as expected response size is read, so it fires on errors only)
+Modbus_FrameTimeout=2
+# delays between polls of the response regs (secs): grows from min to max by backoff factor
+Modbus_PollMinDelay=0.002
+Modbus_PollMaxDelay=0.05
+Modbus_PollBackoff=1.6
 
 ######
 #
 # Decode/comment Opentherm data
 #
 ######
+# OTData pos formats: bit of high/low byte ("HB3", "LB0") and bit range of the whole 16-bit word ("8-15")
+POS_BIT_RE = re.compile(r"([HL])B(\d)$")
+POS_RANGE_RE = re.compile(r"(\d+)-(\d+)$")
+
+# resolve OTData pos ("" for the whole word) to (shift, mask) of the 16-bit data-value
+def pos_bits(pos):
+    if pos == "":
+        return 0, 0xffff
+    m = POS_BIT_RE.match(pos)
+    if m:
+        return (8 if m.group(1) == "H" else 0) + int(m.group(2)), 1
+    m = POS_RANGE_RE.match(pos)
+    if m:
+        lo, hi = int(m.group(1)), int(m.group(2))
+        return lo, (1 << (hi - lo + 1)) - 1
+    raise ValueError("Invalid opentherm data position \'" + pos + "\'")
+
+# OTData conditional descr: "<op><number> text" clauses separated by ';'
+DESCR_COND_RE = re.compile(r"(==|!=|<=|>=|<|>)(-?\d+) (.*)$", re.S)
+DESCR_COND_OPS = { "==": operator.eq, "!=": operator.ne, "<=": operator.le, ">=": operator.ge, "<": operator.lt, ">": operator.gt }
+
+# parse conditional descr to a tuple of (op, number, text), None for plain descr
+def descr_conds(descr):
+    if ';' not in descr:
+        return None
+    conds = []
+    for d in descr.split(';'):
+        m = DESCR_COND_RE.match(d)
+        if not m:
+            raise ValueError("Invalid opentherm conditional description \'" + d + "\'")
+        conds.append((DESCR_COND_OPS[m.group(1)], int(m.group(2)), m.group(3)))
+    return tuple(conds)
+
+# opentherm data-value decoders by OTData fmt: (16-bit value, shift, mask) -> (string representation, numeric value)
+def decode_u8(value, shift, mask):
+    v = (value >> shift) & mask & 0xff
+    return "%u" % v, v
+
+def decode_u16(value, shift, mask):
+    v = value & 0xffff
+    return "%u" % v, v
+
+def decode_s8(value, shift, mask):
+    v = (value >> shift) & mask & 0xff
+    if v > 127:
+        return "-%u" % (256 - v), v - 256
+    else:
+        return "%u" % v, v
+
+def decode_s16(value, shift, mask):
+    v = value & 0xffff
+    if value > 32767:
+        return "-%u" % (65536 - v), v - 65536
+    else:
+        return "%u" % v, v
+
+# 1/256 gives 0.00390625 i.e. 8 fractional decimal digits but it useless in this certain practical case, let's limit output to 3 decimal digits to get something out of smallest possible number;
+# fractional part is taken from the table of all 256 fractions (".5", ".004", "" for zero etc) rounded once at import
+F88_FRAC = tuple(("%.3f" % (f/256)).rstrip('0').rstrip('.')[1:] for f in range(256)) # default %f formatting produces extra trailing zeroes
+
+def decode_f88(value, shift, mask):
+    v = value & 0xffff
+    if v > 32767:
+        v = 65536 - v
+        return "-%u%s" % (v >> 8, F88_FRAC[v & 0xff]), -v/256
+    else:
+        return "%u%s" % (v >> 8, F88_FRAC[v & 0xff]), v/256
+
+FMT_HANDLERS = {
+    "BF": decode_u8,
+    "U8": decode_u8,
+    "U16": decode_u16,
+    "S8": decode_s8,
+    "S16": decode_s16,
+    "F8.8": decode_f88,
+}
+
 class OTData:
+    __slots__ = ("data_id", "t_dir", "pos", "fmt", "min", "max", "units", "descr", "shift", "mask", "conds", "decode")
+
     def __init__(self, data_id, t_dir, pos, fmt, min, max, units, descr):
         self.data_id = data_id  # OT data-id
         self.t_dir = t_dir      # transfer direction ('R' - from slave, 'W' - to slave, 'RW' - both, 
@@ -110,589 +219,622 @@ class OTData:
         self.max = max          # max value
         self.units = units      # value units
         self.descr = descr      # data description (could contains conditional (==/>=/<=) descriptions
-
-class OTDecoder:
-    def __init__(self):
-        self.OT_MSGS = { 
-            OT_READ_DATA: "READ-DATA",
-            OT_WRITE_DATA: "WRITE-DATA",
-            OT_INVALID_DATA: "INVALID-DATA",
-            OT_RESERVED: "OT-RESERVED",
-            OT_READ_ACK:"READ-ACK", 
-            OT_WRITE_ACK:"WRITE-ACK", 
-            OT_DATA_INVALID:"DATA-INVALID", 
-            OT_UNKNOWN_DATA_ID:"UNKNOWN-DATAID" }
-        # Opentherm DATA-ID descriptions collected from 
-        #   Opentherm%20Protocol%20v2-2.pdf
-        #   https://www.opentherm.eu/request-details
-        #   http://otgw.tclcode.com/firmware.html
-        #   +forums and other sources...
-        self.otd = collections.OrderedDict()
-        self.otd["000"]      = OTData("000", "RI", "",    "BF", 0, 1, "", "Master/slave status")
-        self.otd["000I"]     = OTData("000", "R", "",    "BF", 0, 1, "", "Master/slave status")
-        self.otd["000I:HB0"] = OTData("000", "R", "HB0", "BF", 0, 1, "", "Master status: CH enable")
-        self.otd["000I:HB1"] = OTData("000", "R", "HB1", "BF", 0, 1, "", "Master status: DHW enable")
-        self.otd["000I:HB2"] = OTData("000", "R", "HB2", "BF", 0, 1, "", "Master status: Cooling enable")
-        self.otd["000I:HB3"] = OTData("000", "R", "HB3", "BF", 0, 1, "", "Master status: OTC active")
-        self.otd["000I:HB4"] = OTData("000", "R", "HB4", "BF", 0, 1, "", "Master status: CH2 enable")
-        self.otd["000I:HB5"] = OTData("000", "R", "HB5", "BF", 0, 1, "", "Master status: Summer mode")  # 0 - winter, 1 - summer
-        self.otd["000I:HB6"] = OTData("000", "R", "HB6", "BF", 0, 1, "", "Master status: DHW blocked")  # 0 - DHW unblocked, 1 - blocked
-        self.otd["000I:HB7"] = OTData("000", "R", "HB7", "BF", 0, 1, "", "Master status: reserved")
-        self.otd["000:HB0"]  = OTData("000", "R", "HB0", "BF", 0, 1, "", "Master status: CH enable")
-        self.otd["000:HB1"]  = OTData("000", "R", "HB1", "BF", 0, 1, "", "Master status: DHW enable")
-        self.otd["000:HB2"]  = OTData("000", "R", "HB2", "BF", 0, 1, "", "Master status: Cooling enable")
-        self.otd["000:HB3"]  = OTData("000", "R", "HB3", "BF", 0, 1, "", "Master status: OTC active")
-        self.otd["000:HB4"]  = OTData("000", "R", "HB4", "BF", 0, 1, "", "Master status: CH2 enable")
-        self.otd["000:HB5"]  = OTData("000", "R", "HB5", "BF", 0, 1, "", "Master status: Summer/winter mode")
-        self.otd["000:HB6"]  = OTData("000", "R", "HB6", "BF", 0, 1, "", "Master status: DHW blocking")
-        self.otd["000:HB7"]  = OTData("000", "R", "HB7", "BF", 0, 1, "", "Master status: reserved")
-        self.otd["000:LB0"]  = OTData("000", "R", "LB0", "BF", 0, 1, "", "Slave Status: Fault")
-        self.otd["000:LB1"]  = OTData("000", "R", "LB1", "BF", 0, 1, "", "Slave Status: CH mode")
-        self.otd["000:LB2"]  = OTData("000", "R", "LB2", "BF", 0, 1, "", "Slave Status: DHW mode")
-        self.otd["000:LB3"]  = OTData("000", "R", "LB3", "BF", 0, 1, "", "Slave Status: Flame on")
-        self.otd["000:LB4"]  = OTData("000", "R", "LB4", "BF", 0, 1, "", "Slave Status: Cooling on")
-        self.otd["000:LB5"]  = OTData("000", "R", "LB5", "BF", 0, 1, "", "Slave Status: CH2 active")
-        self.otd["000:LB6"]  = OTData("000", "R", "LB6", "BF", 0, 1, "", "Slave Status: Diagnostic/service indication")
-        self.otd["000:LB7"]  = OTData("000", "R", "LB7", "BF", 0, 1, "", "Slave Status: Electricity production")
-        self.otd["001"]      = OTData("001", "RW", "",    "", 0, 100, "°C", "CH water temperature Setpoint")
-        self.otd["001W"]     = OTData("001", "W", "",    "F8.8", 0, 100, "°C", "CH water temperature Setpoint")
-        self.otd["001R"]     = OTData("001", "R", "",    "F8.8", 0, 100, "°C", "CH water temperature Setpoint")
-        self.otd["002"]      = OTData("002", "W", "",    "BF", 0, 1, "", "Master configuration")
-        self.otd["002:LB"]   = OTData("002", "W", "0-7", "U8", 0, 255, "", "Master configuration: MemberId code")
-        self.otd["002:HB0"]  = OTData("002", "W", "HB0", "BF", 0, 1, "", "Master configuration: Smart power")
-        self.otd["003"]      = OTData("003", "R", "",    "BF", 0, 1, "", "Slave configuration")
-        self.otd["003:LB"]   = OTData("003", "R", "0-7", "U8", 0, 255, "", "Slave configuration: MemberId code")
-        self.otd["003:HB0"]  = OTData("003", "R", "HB0", "BF", 0, 1, "", "Slave configuration: DHW present")
-        self.otd["003:HB1"]  = OTData("003", "R", "HB1", "BF", 0, 1, "", "Slave configuration: On/Off control only")
-        self.otd["003:HB2"]  = OTData("003", "R", "HB2", "BF", 0, 1, "", "Slave configuration: Cooling supported")
-        self.otd["003:HB3"]  = OTData("003", "R", "HB3", "BF", 0, 1, "", "Slave configuration: DHW configuration")
-        self.otd["003:HB4"]  = OTData("003", "R", "HB4", "BF", 0, 1, "", "Slave configuration: Master low-off&pump control allowed")
-        self.otd["003:HB5"]  = OTData("003", "R", "HB5", "BF", 0, 1, "", "Slave configuration: CH2 present")
-        self.otd["003:HB6"]  = OTData("003", "R", "HB6", "BF", 0, 1, "", "Slave configuration: Remote water filling function")
-        self.otd["003:HB7"]  = OTData("003", "R", "HB7", "BF", 0, 1, "", "Heat/cool mode control")
-        self.otd["004"]      = OTData("004", "RW", "",   "",   0, 0, "", "Slave control")
-        self.otd["004W"]     = OTData("004", "W", "8-15", "U8", 0, 255, "", "==1 Boiler Lockout-reset;==10 Service request reset;==2 Request Water filling")
-        self.otd["004R"]     = OTData("004", "R", "0-7", "U8", 0, 255, "", ">127 response ok;<128 response error")
-        self.otd["005"]      = OTData("005", "R", "",    "BF", 0, 1, "", "Boiler faults")
-        self.otd["005:HB0"]  = OTData("005", "R", "HB0", "BF", 0, 1, "", "Service required")
-        self.otd["005:HB1"]  = OTData("005", "R", "HB1", "BF", 0, 1, "", "Lockout-reset enabled")
-        self.otd["005:HB2"]  = OTData("005", "R", "HB2", "BF", 0, 1, "", "Low water pressure")
-        self.otd["005:HB3"]  = OTData("005", "R", "HB3", "BF", 0, 1, "", "Gas/flame fault")
-        self.otd["005:HB4"]  = OTData("005", "R", "HB4", "BF", 0, 1, "", "Air pressure fault")
-        self.otd["005:HB5"]  = OTData("005", "R", "HB5", "BF", 0, 1, "", "Water over-temperature")
-        self.otd["005:LB"]   = OTData("005", "R", "0-7", "U8", 0, 255, "", "OEM fault code")
-        self.otd["006"]      = OTData("006", "R", "",    "BF", 0, 1, "", "Remote boiler parameters")
-        self.otd["006:HB0"]  = OTData("006", "R", "HB0", "BF", 0, 1, "", "transfer-enabled: DHW setpoint")
-        self.otd["006:HB1"]  = OTData("006", "R", "HB1", "BF", 0, 1, "", "transfer-enabled: max. CH setpoint")
-        self.otd["006:HB2"]  = OTData("006", "R", "HB2", "BF", 0, 1, "", "transfer-enabled: param 2 (OTC HC ratio)") # unsure
-        self.otd["006:HB3"]  = OTData("006", "R", "HB3", "BF", 0, 1, "", "transfer-enabled: param 3")
-        self.otd["006:HB4"]  = OTData("006", "R", "HB4", "BF", 0, 1, "", "transfer-enabled: param 4")
-        self.otd["006:HB5"]  = OTData("006", "R", "HB5", "BF", 0, 1, "", "transfer-enabled: param 5")
-        self.otd["006:HB6"]  = OTData("006", "R", "HB6", "BF", 0, 1, "", "transfer-enabled: param 6")
-        self.otd["006:HB7"]  = OTData("006", "R", "HB7", "BF", 0, 1, "", "transfer-enabled: param 7")
-        self.otd["006:LB0"]  = OTData("006", "R", "LB0", "BF", 0, 1, "", "read/write: DHW setpoint")
-        self.otd["006:LB1"]  = OTData("006", "R", "LB1", "BF", 0, 1, "", "read/write: max. CH setpoint")
-        self.otd["006:LB2"]  = OTData("006", "R", "LB2", "BF", 0, 1, "", "read/write: param 2 (OTC HC ratio)") # unsure
-        self.otd["006:LB3"]  = OTData("006", "R", "LB3", "BF", 0, 1, "", "read/write: param 3")
-        self.otd["006:LB4"]  = OTData("006", "R", "LB4", "BF", 0, 1, "", "read/write: param 4")
-        self.otd["006:LB5"]  = OTData("006", "R", "LB5", "BF", 0, 1, "", "read/write: param 5")
-        self.otd["006:LB6"]  = OTData("006", "R", "LB6", "BF", 0, 1, "", "read/write: param 6")
-        self.otd["006:LB7"]  = OTData("006", "R", "LB7", "BF", 0, 1, "", "read/write: param 7")
-        self.otd["007"]      = OTData("007", "W", "",    "F8.8", 0, 100, "%", "Cooling control signal")
-        self.otd["008"]      = OTData("008", "W", "",    "F8.8", 0, 100, "°C", "Control Setpoint for 2nd CH circuit")
-        self.otd["009"]      = OTData("009", "R", "",    "F8.8", 0, 30, "", "Remote override room Setpoint") # 0 - no override
-        self.otd["010"]      = OTData("010", "R", "8-15", "U8", 0, 255, "", "Number of Transparent-Slave-Parameters supported by slave")
-        self.otd["011"]      = OTData("011", "RW", "",   "",  0, 0,  "", "Index/Value of transparent slave parameter")
-        self.otd["011R"]     = OTData("011", "R", "",    "BF", 0, 9, "", "Transparent slave parameter")
-        self.otd["011R:HB"]  = OTData("011", "R", "8-15", "U8", 0, 255, "", "Index of read transparent slave parameter")
-        self.otd["011R:LB"]  = OTData("011", "R", "0-7", "U8", 0, 255, "", "Value of read transparent slave parameter")
-        self.otd["011W"]     = OTData("011", "W", "",    "BF", 0, 1, "", "Transparent slave parameter to write")
-        self.otd["011W:HB"]  = OTData("011", "W", "8-15","U8", 0, 255, "", "Index of referred-to transparent slave parameter to write")
-        self.otd["011W:LB"]  = OTData("011", "W", "0-7", "U8", 0, 255, "", "Value of referred-to transparent slave parameter to write")
-        self.otd["012"]      = OTData("012", "R", "8-15", "U8"  , 0, 255, "", "Size of Fault-History-Buffer supported by slave")
-        self.otd["013"]      = OTData("013", "R", ""   , "BF", 0, 1, "", "Fault-history buffer entry")
-        self.otd["013:HB"]   = OTData("013", "R", "8-15", "U8", 0, 255, "", "Index number")
-        self.otd["013:LB"]   = OTData("013", "R", "0-7", "U8", 0, 255, "", "Entry Value")
-        self.otd["014"]      = OTData("014", "W", ""   , "F8.8", 0, 100, "", "Maximum relative modulation level setting (%)")
-        self.otd["015"]      = OTData("015", "R", ""   , "BF", 0, 0, "", "Boiler capacities")
-        self.otd["015:HB"]   = OTData("015", "R", "8-15", "U8" , 0, 255, "kW", "Maximum boiler capacity")
-        self.otd["015:LB"]   = OTData("015", "R", "0-7", "U8", 0, 100, "%", "Minimum boiler modulation level")
-        self.otd["016"]      = OTData("016", "W", ""   , "F8.8", -40, 127, "°C", "Room Setpoint")
-        self.otd["017"]      = OTData("017", "R", ""   , "F8.8", 0, 100, "%", "Relative Modulation Level")
-        self.otd["018"]      = OTData("018", "R", ""   , "F8.8", 0, 5, "bar", "Water pressure in CH circuit")
-        self.otd["019"]      = OTData("019", "R", ""   , "F8.8", 0, 16, "l/min", "Water flow rate in DHW circuit")
-        self.otd["020"]      = OTData("020", "RW", ""  , ""  , 0, 0, "", "Time and DoW")
-        self.otd["020R"]     = OTData("020", "R", ""   , "BF"  , 0, 0, "", "")
-        self.otd["020R:HB0"] = OTData("020", "R", "13-15", "U8", 0, 7, "", "Day of Week")
-        self.otd["020R:HB1"] = OTData("020", "R", "8-12", "U8", 0, 23, "", "Hours")
-        self.otd["020R:LB"]  = OTData("020", "R", "0-7", "U8", 0, 59, "", "Minutes")
-        self.otd["020W"]     = OTData("020", "W", ""   , ""  , 0, 0, "", "Day of Week and Time of Day")
-        self.otd["020W:HB0"] = OTData("020", "W", "13-15", "U8", 0, 7, "", "Day of Week")
-        self.otd["020W:HB1"] = OTData("020", "W", "8-12", "U8", 0, 23, "", "Hours")
-        self.otd["020W:LB"]  = OTData("020", "W", "0-7", "U8", 0, 59, "", "Minutes")
-        self.otd["021"]      = OTData("021", "RW", ""   , ""  , 0, 0, "", "Calendar date")
-        self.otd["021R"]     = OTData("021", "R", ""   , "BF", 0, 0, "", "Calendar date")
-        self.otd["021R:HB"]  = OTData("021", "R", "8-15", "U8", 1, 12, "", "Month")
-        self.otd["021R:LB"]  = OTData("021", "R", "0-7", "U8", 1, 31, "", "Day")
-        self.otd["021W"]     = OTData("021", "W", ""   , "BF", 0, 0, "", "")
-        self.otd["021W:HB"]  = OTData("021", "W", "8-15", "U8", 1, 12, "", "Month")
-        self.otd["021W:LB"]  = OTData("021", "W", "0-7", "U8", 1, 31, "", "Day")
-        self.otd["022"]      = OTData("022", "RW", ""  , ""  , 0, 0, "", "Calendar year")
-        self.otd["022R"]     = OTData("022", "R", ""   , "U16", 0, 65535, "", "Year")
-        self.otd["022W"]     = OTData("022", "W", ""   , "U16", 0, 65535, "", "Year")
-        self.otd["023"]      = OTData("023", "W", ""   , "F8.8", -40, 127, "°C", "Room Setpoint for 2nd CH circuit")
-        self.otd["024"]      = OTData("024", "W", ""   , "F8.8", -40, 127, "°C", "Room temperature (°C)")
-        self.otd["025"]      = OTData("025", "R", ""   , "F8.8", -40, 127, "°C", "Boiler flow water temperature")
-        self.otd["026"]      = OTData("026", "R", ""   , "F8.8", -40, 127, "°C", "DHW temperature")
-        self.otd["027"]      = OTData("027", "R", ""   , "F8.8", -40, 127, "°C", "Outside temperature")
-        self.otd["028"]      = OTData("028", "R", ""   , "F8.8", -40, 127, "°C", "Return water temperature")
-        self.otd["029"]      = OTData("029", "R", ""   , "F8.8", -40, 127, "°C", "Solar storage temperature")
-        self.otd["030"]      = OTData("030", "R", ""   , "S16", -40, 250, "°C", "Solar collector temperature")
-        self.otd["031"]      = OTData("031", "R", ""   , "F8.8", -40, 127, "°C", "Flow water temperature CH2 circuit")
-        self.otd["032"]      = OTData("032", "R", ""   , "F8.8", -40, 127, "°C", "Domestic hot water temperature 2")
-        self.otd["033"]      = OTData("033", "R", ""   , "S16", -40, 500, "°C", "Boiler exhaust temperature")
-        self.otd["034"]      = OTData("034", "R", ""   , "F8.8", -40, 127, "°C", "Boiler heat exchanger temperature") # unsure
-        self.otd["035"]      = OTData("035", "R", ""   , "U16"  , 0, 0, "", "Boiler fan speed") # rpm/60? unsure
+        self.shift, self.mask = pos_bits(pos)   # pos precomputed as (value >> shift) & mask
+        self.conds = descr_conds(descr)         # conditional descr precomputed as (op, number, text) tuples
+        self.decode = FMT_HANDLERS.get(fmt)     # value decoder for fmt (None if the format is unknown)
+
+# Opentherm DATA-ID descriptions collected from
+#   Opentherm%20Protocol%20v2-2.pdf
+#   https://www.opentherm.eu/request-details
+#   http://otgw.tclcode.com/firmware.html
+#   +forums and other sources...
+# (otd key, data-id, t_dir, pos, fmt, min, max, units, descr)
+OT_DATA_TABLE = (
+    ("000",      "000", "RI", "",    "BF", 0, 1, "", "Master/slave status"),
+    ("000I",     "000", "R", "",    "BF", 0, 1, "", "Master/slave status"),
+    ("000I:HB0", "000", "R", "HB0", "BF", 0, 1, "", "Master status: CH enable"),
+    ("000I:HB1", "000", "R", "HB1", "BF", 0, 1, "", "Master status: DHW enable"),
+    ("000I:HB2", "000", "R", "HB2", "BF", 0, 1, "", "Master status: Cooling enable"),
+    ("000I:HB3", "000", "R", "HB3", "BF", 0, 1, "", "Master status: OTC active"),
+    ("000I:HB4", "000", "R", "HB4", "BF", 0, 1, "", "Master status: CH2 enable"),
+    ("000I:HB5", "000", "R", "HB5", "BF", 0, 1, "", "Master status: Summer mode"),  # 0 - winter, 1 - summer
+    ("000I:HB6", "000", "R", "HB6", "BF", 0, 1, "", "Master status: DHW blocked"),  # 0 - DHW unblocked, 1 - blocked
+    ("000I:HB7", "000", "R", "HB7", "BF", 0, 1, "", "Master status: reserved"),
+    ("000:HB0",  "000", "R", "HB0", "BF", 0, 1, "", "Master status: CH enable"),
+    ("000:HB1",  "000", "R", "HB1", "BF", 0, 1, "", "Master status: DHW enable"),
+    ("000:HB2",  "000", "R", "HB2", "BF", 0, 1, "", "Master status: Cooling enable"),
+    ("000:HB3",  "000", "R", "HB3", "BF", 0, 1, "", "Master status: OTC active"),
+    ("000:HB4",  "000", "R", "HB4", "BF", 0, 1, "", "Master status: CH2 enable"),
+    ("000:HB5",  "000", "R", "HB5", "BF", 0, 1, "", "Master status: Summer/winter mode"),
+    ("000:HB6",  "000", "R", "HB6", "BF", 0, 1, "", "Master status: DHW blocking"),
+    ("000:HB7",  "000", "R", "HB7", "BF", 0, 1, "", "Master status: reserved"),
+    ("000:LB0",  "000", "R", "LB0", "BF", 0, 1, "", "Slave Status: Fault"),
+    ("000:LB1",  "000", "R", "LB1", "BF", 0, 1, "", "Slave Status: CH mode"),
+    ("000:LB2",  "000", "R", "LB2", "BF", 0, 1, "", "Slave Status: DHW mode"),
+    ("000:LB3",  "000", "R", "LB3", "BF", 0, 1, "", "Slave Status: Flame on"),
+    ("000:LB4",  "000", "R", "LB4", "BF", 0, 1, "", "Slave Status: Cooling on"),
+    ("000:LB5",  "000", "R", "LB5", "BF", 0, 1, "", "Slave Status: CH2 active"),
+    ("000:LB6",  "000", "R", "LB6", "BF", 0, 1, "", "Slave Status: Diagnostic/service indication"),
+    ("000:LB7",  "000", "R", "LB7", "BF", 0, 1, "", "Slave Status: Electricity production"),
+    ("001",      "001", "RW", "",    "", 0, 100, "°C", "CH water temperature Setpoint"),
+    ("001W",     "001", "W", "",    "F8.8", 0, 100, "°C", "CH water temperature Setpoint"),
+    ("001R",     "001", "R", "",    "F8.8", 0, 100, "°C", "CH water temperature Setpoint"),
+    ("002",      "002", "W", "",    "BF", 0, 1, "", "Master configuration"),
+    ("002:LB",   "002", "W", "0-7", "U8", 0, 255, "", "Master configuration: MemberId code"),
+    ("002:HB0",  "002", "W", "HB0", "BF", 0, 1, "", "Master configuration: Smart power"),
+    ("003",      "003", "R", "",    "BF", 0, 1, "", "Slave configuration"),
+    ("003:LB",   "003", "R", "0-7", "U8", 0, 255, "", "Slave configuration: MemberId code"),
+    ("003:HB0",  "003", "R", "HB0", "BF", 0, 1, "", "Slave configuration: DHW present"),
+    ("003:HB1",  "003", "R", "HB1", "BF", 0, 1, "", "Slave configuration: On/Off control only"),
+    ("003:HB2",  "003", "R", "HB2", "BF", 0, 1, "", "Slave configuration: Cooling supported"),
+    ("003:HB3",  "003", "R", "HB3", "BF", 0, 1, "", "Slave configuration: DHW configuration"),
+    ("003:HB4",  "003", "R", "HB4", "BF", 0, 1, "", "Slave configuration: Master low-off&pump control allowed"),
+    ("003:HB5",  "003", "R", "HB5", "BF", 0, 1, "", "Slave configuration: CH2 present"),
+    ("003:HB6",  "003", "R", "HB6", "BF", 0, 1, "", "Slave configuration: Remote water filling function"),
+    ("003:HB7",  "003", "R", "HB7", "BF", 0, 1, "", "Heat/cool mode control"),
+    ("004",      "004", "RW", "",   "",   0, 0, "", "Slave control"),
+    ("004W",     "004", "W", "8-15", "U8", 0, 255, "", "==1 Boiler Lockout-reset;==10 Service request reset;==2 Request Water filling"),
+    ("004R",     "004", "R", "0-7", "U8", 0, 255, "", ">127 response ok;<128 response error"),
+    ("005",      "005", "R", "",    "BF", 0, 1, "", "Boiler faults"),
+    ("005:HB0",  "005", "R", "HB0", "BF", 0, 1, "", "Service required"),
+    ("005:HB1",  "005", "R", "HB1", "BF", 0, 1, "", "Lockout-reset enabled"),
+    ("005:HB2",  "005", "R", "HB2", "BF", 0, 1, "", "Low water pressure"),
+    ("005:HB3",  "005", "R", "HB3", "BF", 0, 1, "", "Gas/flame fault"),
+    ("005:HB4",  "005", "R", "HB4", "BF", 0, 1, "", "Air pressure fault"),
+    ("005:HB5",  "005", "R", "HB5", "BF", 0, 1, "", "Water over-temperature"),
+    ("005:LB",   "005", "R", "0-7", "U8", 0, 255, "", "OEM fault code"),
+    ("006",      "006", "R", "",    "BF", 0, 1, "", "Remote boiler parameters"),
+    ("006:HB0",  "006", "R", "HB0", "BF", 0, 1, "", "transfer-enabled: DHW setpoint"),
+    ("006:HB1",  "006", "R", "HB1", "BF", 0, 1, "", "transfer-enabled: max. CH setpoint"),
+    ("006:HB2",  "006", "R", "HB2", "BF", 0, 1, "", "transfer-enabled: param 2 (OTC HC ratio)"), # unsure
+    ("006:HB3",  "006", "R", "HB3", "BF", 0, 1, "", "transfer-enabled: param 3"),
+    ("006:HB4",  "006", "R", "HB4", "BF", 0, 1, "", "transfer-enabled: param 4"),
+    ("006:HB5",  "006", "R", "HB5", "BF", 0, 1, "", "transfer-enabled: param 5"),
+    ("006:HB6",  "006", "R", "HB6", "BF", 0, 1, "", "transfer-enabled: param 6"),
+    ("006:HB7",  "006", "R", "HB7", "BF", 0, 1, "", "transfer-enabled: param 7"),
+    ("006:LB0",  "006", "R", "LB0", "BF", 0, 1, "", "read/write: DHW setpoint"),
+    ("006:LB1",  "006", "R", "LB1", "BF", 0, 1, "", "read/write: max. CH setpoint"),
+    ("006:LB2",  "006", "R", "LB2", "BF", 0, 1, "", "read/write: param 2 (OTC HC ratio)"), # unsure
+    ("006:LB3",  "006", "R", "LB3", "BF", 0, 1, "", "read/write: param 3"),
+    ("006:LB4",  "006", "R", "LB4", "BF", 0, 1, "", "read/write: param 4"),
+    ("006:LB5",  "006", "R", "LB5", "BF", 0, 1, "", "read/write: param 5"),
+    ("006:LB6",  "006", "R", "LB6", "BF", 0, 1, "", "read/write: param 6"),
+    ("006:LB7",  "006", "R", "LB7", "BF", 0, 1, "", "read/write: param 7"),
+    ("007",      "007", "W", "",    "F8.8", 0, 100, "%", "Cooling control signal"),
+    ("008",      "008", "W", "",    "F8.8", 0, 100, "°C", "Control Setpoint for 2nd CH circuit"),
+    ("009",      "009", "R", "",    "F8.8", 0, 30, "", "Remote override room Setpoint"), # 0 - no override
+    ("010",      "010", "R", "8-15", "U8", 0, 255, "", "Number of Transparent-Slave-Parameters supported by slave"),
+    ("011",      "011", "RW", "",   "",  0, 0,  "", "Index/Value of transparent slave parameter"),
+    ("011R",     "011", "R", "",    "BF", 0, 9, "", "Transparent slave parameter"),
+    ("011R:HB",  "011", "R", "8-15", "U8", 0, 255, "", "Index of read transparent slave parameter"),
+    ("011R:LB",  "011", "R", "0-7", "U8", 0, 255, "", "Value of read transparent slave parameter"),
+    ("011W",     "011", "W", "",    "BF", 0, 1, "", "Transparent slave parameter to write"),
+    ("011W:HB",  "011", "W", "8-15","U8", 0, 255, "", "Index of referred-to transparent slave parameter to write"),
+    ("011W:LB",  "011", "W", "0-7", "U8", 0, 255, "", "Value of referred-to transparent slave parameter to write"),
+    ("012",      "012", "R", "8-15", "U8"  , 0, 255, "", "Size of Fault-History-Buffer supported by slave"),
+    ("013",      "013", "R", ""   , "BF", 0, 1, "", "Fault-history buffer entry"),
+    ("013:HB",   "013", "R", "8-15", "U8", 0, 255, "", "Index number"),
+    ("013:LB",   "013", "R", "0-7", "U8", 0, 255, "", "Entry Value"),
+    ("014",      "014", "W", ""   , "F8.8", 0, 100, "", "Maximum relative modulation level setting (%)"),
+    ("015",      "015", "R", ""   , "BF", 0, 0, "", "Boiler capacities"),
+    ("015:HB",   "015", "R", "8-15", "U8" , 0, 255, "kW", "Maximum boiler capacity"),
+    ("015:LB",   "015", "R", "0-7", "U8", 0, 100, "%", "Minimum boiler modulation level"),
+    ("016",      "016", "W", ""   , "F8.8", -40, 127, "°C", "Room Setpoint"),
+    ("017",      "017", "R", ""   , "F8.8", 0, 100, "%", "Relative Modulation Level"),
+    ("018",      "018", "R", ""   , "F8.8", 0, 5, "bar", "Water pressure in CH circuit"),
+    ("019",      "019", "R", ""   , "F8.8", 0, 16, "l/min", "Water flow rate in DHW circuit"),
+    ("020",      "020", "RW", ""  , ""  , 0, 0, "", "Time and DoW"),
+    ("020R",     "020", "R", ""   , "BF"  , 0, 0, "", ""),
+    ("020R:HB0", "020", "R", "13-15", "U8", 0, 7, "", "Day of Week"),
+    ("020R:HB1", "020", "R", "8-12", "U8", 0, 23, "", "Hours"),
+    ("020R:LB",  "020", "R", "0-7", "U8", 0, 59, "", "Minutes"),
+    ("020W",     "020", "W", ""   , ""  , 0, 0, "", "Day of Week and Time of Day"),
+    ("020W:HB0", "020", "W", "13-15", "U8", 0, 7, "", "Day of Week"),
+    ("020W:HB1", "020", "W", "8-12", "U8", 0, 23, "", "Hours"),
+    ("020W:LB",  "020", "W", "0-7", "U8", 0, 59, "", "Minutes"),
+    ("021",      "021", "RW", ""   , ""  , 0, 0, "", "Calendar date"),
+    ("021R",     "021", "R", ""   , "BF", 0, 0, "", "Calendar date"),
+    ("021R:HB",  "021", "R", "8-15", "U8", 1, 12, "", "Month"),
+    ("021R:LB",  "021", "R", "0-7", "U8", 1, 31, "", "Day"),
+    ("021W",     "021", "W", ""   , "BF", 0, 0, "", ""),
+    ("021W:HB",  "021", "W", "8-15", "U8", 1, 12, "", "Month"),
+    ("021W:LB",  "021", "W", "0-7", "U8", 1, 31, "", "Day"),
+    ("022",      "022", "RW", ""  , ""  , 0, 0, "", "Calendar year"),
+    ("022R",     "022", "R", ""   , "U16", 0, 65535, "", "Year"),
+    ("022W",     "022", "W", ""   , "U16", 0, 65535, "", "Year"),
+    ("023",      "023", "W", ""   , "F8.8", -40, 127, "°C", "Room Setpoint for 2nd CH circuit"),
+    ("024",      "024", "W", ""   , "F8.8", -40, 127, "°C", "Room temperature (°C)"),
+    ("025",      "025", "R", ""   , "F8.8", -40, 127, "°C", "Boiler flow water temperature"),
+    ("026",      "026", "R", ""   , "F8.8", -40, 127, "°C", "DHW temperature"),
+    ("027",      "027", "R", ""   , "F8.8", -40, 127, "°C", "Outside temperature"),
+    ("028",      "028", "R", ""   , "F8.8", -40, 127, "°C", "Return water temperature"),
+    ("029",      "029", "R", ""   , "F8.8", -40, 127, "°C", "Solar storage temperature"),
+    ("030",      "030", "R", ""   , "S16", -40, 250, "°C", "Solar collector temperature"),
+    ("031",      "031", "R", ""   , "F8.8", -40, 127, "°C", "Flow water temperature CH2 circuit"),
+    ("032",      "032", "R", ""   , "F8.8", -40, 127, "°C", "Domestic hot water temperature 2"),
+    ("033",      "033", "R", ""   , "S16", -40, 500, "°C", "Boiler exhaust temperature"),
+    ("034",      "034", "R", ""   , "F8.8", -40, 127, "°C", "Boiler heat exchanger temperature"), # unsure
+    ("035",      "035", "R", ""   , "U16"  , 0, 0, "", "Boiler fan speed"), # rpm/60? unsure
 # could also be
-#        self.otd["035:HB"]      = OTData("035", "R", ""   , "U8"  , 0, 255, "", "Boiler fan speed Setpoint")
-#        self.otd["035:LB"]      = OTData("035", "R", ""   , "U8"  , 0, 255, "", "Boiler fan speed actual value")
-        self.otd["036"]      = OTData("036", "R", ""   , "F8.8"  , -128, 127, "µA", "Electrical current through burner flame") # unsure
-        self.otd["037"]      = OTData("037", "W", ""   , "F8.8"  , -40, 127, "°C", "Room temperature for 2nd CH circuit") # unsure
-        self.otd["038"]      = OTData("038", "W", ""   , "F8.8"  , 0, 0, "%", "Relative Humidity") # unsure
-        self.otd["048"]      = OTData("048", "R", ""   , "BF"  , 0, 0, "", "DHW Setpoint bounds for adjustment")
-        self.otd["048:HB"]   = OTData("048", "R", "8-15", "S8" , 0, 127, "°C", "Upper bound")
-        self.otd["048:LB"]   = OTData("048", "R", "0-7", "S8"  , 0, 127, "°C", "Lower bound")
-        self.otd["049"]      = OTData("049", "R", ""   , "BF"  , 0, 0, "°C", "Max CH water Setpoint bounds for adjustment")
-        self.otd["049:HB"]   = OTData("049", "R", "8-15", "S8" , 0, 127, "°C", "Upper bound")
-        self.otd["049:LB"]   = OTData("049", "R", "0-7", "S8"  , 0, 127, "°C", "Lower bound")
-        self.otd["050"]      = OTData("050", "R", ""   , "BF"  , 0, 0, "", "OTC HC-Ratio bounds") # unsure
-        self.otd["050:HB"]   = OTData("050", "R", "8-15", "S8" , -128, 127, "", "Upper bound")
-        self.otd["050:LB"]   = OTData("050", "R", "0-7", "S8"  , -128, 127, "", "Lower bound")
-        self.otd["051"]      = OTData("051", "R", ""   , "BF"  , 0, 0, "", "Remote param 3") # unsure
-        self.otd["051:HB"]   = OTData("051", "R", "8-15", "S8" , -128, 127, "", "Upper bound")
-        self.otd["051:LB"]   = OTData("051", "R", "0-7", "S8"  , -128, 127, "", "Lower bound")
-        self.otd["052"]      = OTData("052", "R", ""   , "BF"  , 0, 0, "", "Remote param 4") # unsure
-        self.otd["052:HB"]   = OTData("052", "R", "8-15", "S8" , -128, 127, "", "Upper bound")
-        self.otd["052:LB"]   = OTData("052", "R", "0-7", "S8"  , -128, 127, "", "Lower bound")
-        self.otd["053"]      = OTData("053", "R", ""   , "BF"  , 0, 0, "", "Remote param 5") # unsure
-        self.otd["053:HB"]   = OTData("053", "R", "8-15", "S8" , -128, 127, "", "Upper bound")
-        self.otd["053:LB"]   = OTData("053", "R", "0-7", "S8"  , -128, 127, "", "Lower bound")
-        self.otd["054"]      = OTData("054", "R", ""   , "BF"  , 0, 0, "", "Remote param 6") # unsure
-        self.otd["054:HB"]   = OTData("054", "R", "8-15", "S8" , -128, 127, "", "Upper bound")
-        self.otd["054:LB"]   = OTData("054", "R", "0-7", "S8"  , -128, 127, "", "Lower bound")
-        self.otd["055"]      = OTData("055", "R", ""   , "BF"  , 0, 0, "", "Remote param 7") # unsure
-        self.otd["055:HB"]   = OTData("055", "R", "8-15", "S8" , -128, 127, "", "Upper bound")
-        self.otd["055:LB"]   = OTData("055", "R", "0-7", "S8"  , -128, 127, "", "Lower bound")
-        self.otd["056"]      = OTData("056", "RW", ""  , ""  , 0, 0, "°C", "DHW Setpoint (Remote param 0)")
-        self.otd["056R"]     = OTData("056", "R", ""   , "F8.8", 0, 127, "°C", "Current DHW Setpoint (Remote param 0)")
-        self.otd["056W"]     = OTData("056", "W", ""   , "F8.8", 0, 127, "°C", "DHW Setpoint to set(Remote param 0)")
-        self.otd["057"]      = OTData("057", "RW", ""  , ""  , 0, 0, "°C", "Max CH water Setpoint (Remote param 1)")
-        self.otd["057R"]     = OTData("057", "R", ""   , "F8.8", 0, 127, "°C", "Current Max CH water Setpoint (Remote param 1)")
-        self.otd["057W"]     = OTData("057", "W", ""   , "F8.8", 0, 127, "°C", "Max CH water Setpoint to set (Remote param 1)")
-        self.otd["058"]      = OTData("058", "RW", ""  , ""  , 0, 0, "°C", "OTC HC Ratio (Remote param 2)") # unsure
-        self.otd["058R"]     = OTData("058", "R", ""   , "F8.8", 0, 127, "°C", "Current OTC HC Ratio (Remote param 2)") # unsure
-        self.otd["058W"]     = OTData("058", "W", ""   , "F8.8", 0, 127, "°C", "OTC HC Ratio to set (Remote param 2)") # unsure
-        self.otd["059"]      = OTData("059", "RW", ""  , ""  , 0, 0, "", "(Remote param 3)")
-        self.otd["059R"]     = OTData("059", "R", ""   , "F8.8", 0, 127, "", "Current (Remote param 3)")
-        self.otd["059W"]     = OTData("059", "W", ""   , "F8.8", 0, 127, "", "to set (Remote param 3)")
-        self.otd["060"]      = OTData("060", "RW", ""  , ""  , 0, 0, "", "(Remote param 4)")
-        self.otd["060R"]     = OTData("060", "R", ""   , "F8.8", 0, 127, "", "Current (Remote param 4)")
-        self.otd["060W"]     = OTData("060", "W", ""   , "F8.8", 0, 127, "", "to set (Remote param 4)")
-        self.otd["061"]      = OTData("061", "RW", ""  , ""  , 0, 0, "", "(Remote param 5)")
-        self.otd["061R"]     = OTData("061", "R", ""   , "F8.8", 0, 127, "", "Current (Remote param 5)")
-        self.otd["061W"]     = OTData("061", "W", ""   , "F8.8", 0, 127, "", "to set (Remote param 5)")
-        self.otd["062"]      = OTData("062", "RW", ""  , ""  , 0, 0, "", "(Remote param 6)")
-        self.otd["062R"]     = OTData("062", "R", ""   , "F8.8", 0, 127, "", "Current (Remote param 6)")
-        self.otd["062W"]     = OTData("062", "W", ""   , "F8.8", 0, 127, "", "to set (Remote param 6)")
-        self.otd["063"]      = OTData("063", "RW", ""  , ""  , 0, 0, "", "(Remote param 7)")
-        self.otd["063R"]     = OTData("063", "R", ""   , "F8.8", 0, 127, "", "Current (Remote param 7)")
-        self.otd["063W"]     = OTData("063", "W", ""   , "F8.8", 0, 127, "", "to set (Remote param 7)")
-        self.otd["070"]      = OTData("070", "R", "",    "BF", 0, 0, "", "Status ventilation / heat-recovery") # unsure
-        self.otd["070:HB0"]  = OTData("070", "R", "HB0", "BF", 0, 1, "", "Master status ventilation / heat-recovery: Ventilation enable") # unsure
-        self.otd["070:HB1"]  = OTData("070", "R", "HB1", "BF", 0, 1, "", "Master status ventilation / heat-recovery: Bypass postion") # unsure
-        self.otd["070:HB2"]  = OTData("070", "R", "HB2", "BF", 0, 1, "", "Master status ventilation / heat-recovery: Bypass mode") # unsure
-        self.otd["070:HB3"]  = OTData("070", "R", "HB3", "BF", 0, 1, "", "Master status ventilation / heat-recovery: Free ventilation mode") # unsure
-        self.otd["070:LB0"]  = OTData("070", "R", "LB0", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Fault indication") # unsure
-        self.otd["070:LB1"]  = OTData("070", "R", "LB1", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Ventilation mode") # unsure
-        self.otd["070:LB2"]  = OTData("070", "R", "LB2", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Bypass status") # unsure
-        self.otd["070:LB3"]  = OTData("070", "R", "LB3", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Bypass automatic status") # unsure
-        self.otd["070:LB4"]  = OTData("070", "R", "LB4", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Free ventilation status") # unsure
-        self.otd["070:LB6"]  = OTData("070", "R", "LB6", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Diagnostic indication") # unsure
-        self.otd["071"]      = OTData("071", "R", ""   , ""  , 0, 0, "", "Relative ventilation position (0-100%). 0% is the minimum set ventilation and 100% is the maximum set ventilation") # unsure
-        self.otd["072"]      = OTData("072", "R", ""   , ""  , 0, 0, "", "Application-specific fault flags and OEM fault code ventilation / heat-recovery") # unsure
-        self.otd["073"]      = OTData("073", "R", ""   , ""  , 0, 0, "", "An OEM-specific diagnostic/service code for ventilation / heat-recovery system") # unsure
-        self.otd["074"]      = OTData("074", "R", "",    "BF", 0, 1, "", "Slave Configuration ventilation / heat-recovery") # unsure
-        self.otd["074:HB0"]  = OTData("074", "R", "HB0", "BF", 0, 1, "", "Ventilation enabled") # unsure
-        self.otd["074:HB1"]  = OTData("074", "R", "HB1", "BF", 0, 1, "", "Bypass position") # unsure
-        self.otd["074:HB2"]  = OTData("074", "R", "HB2", "BF", 0, 1, "", "Bypass mode") # unsure
-        self.otd["074:HB3"]  = OTData("074", "R", "HB3", "BF", 0, 1, "", "Speed control") # unsure
-        self.otd["074:LB"]   = OTData("074", "R", "0-7", "U8", 0, 255, "", "Slave MemberID Code ventilation / heat-recovery") # unsure
+#    ("035:HB",   "035", "R", ""   , "U8"  , 0, 255, "", "Boiler fan speed Setpoint"),
+#    ("035:LB",   "035", "R", ""   , "U8"  , 0, 255, "", "Boiler fan speed actual value"),
+    ("036",      "036", "R", ""   , "F8.8"  , -128, 127, "µA", "Electrical current through burner flame"), # unsure
+    ("037",      "037", "W", ""   , "F8.8"  , -40, 127, "°C", "Room temperature for 2nd CH circuit"), # unsure
+    ("038",      "038", "W", ""   , "F8.8"  , 0, 0, "%", "Relative Humidity"), # unsure
+    ("048",      "048", "R", ""   , "BF"  , 0, 0, "", "DHW Setpoint bounds for adjustment"),
+    ("048:HB",   "048", "R", "8-15", "S8" , 0, 127, "°C", "Upper bound"),
+    ("048:LB",   "048", "R", "0-7", "S8"  , 0, 127, "°C", "Lower bound"),
+    ("049",      "049", "R", ""   , "BF"  , 0, 0, "°C", "Max CH water Setpoint bounds for adjustment"),
+    ("049:HB",   "049", "R", "8-15", "S8" , 0, 127, "°C", "Upper bound"),
+    ("049:LB",   "049", "R", "0-7", "S8"  , 0, 127, "°C", "Lower bound"),
+    ("050",      "050", "R", ""   , "BF"  , 0, 0, "", "OTC HC-Ratio bounds"), # unsure
+    ("050:HB",   "050", "R", "8-15", "S8" , -128, 127, "", "Upper bound"),
+    ("050:LB",   "050", "R", "0-7", "S8"  , -128, 127, "", "Lower bound"),
+    ("051",      "051", "R", ""   , "BF"  , 0, 0, "", "Remote param 3"), # unsure
+    ("051:HB",   "051", "R", "8-15", "S8" , -128, 127, "", "Upper bound"),
+    ("051:LB",   "051", "R", "0-7", "S8"  , -128, 127, "", "Lower bound"),
+    ("052",      "052", "R", ""   , "BF"  , 0, 0, "", "Remote param 4"), # unsure
+    ("052:HB",   "052", "R", "8-15", "S8" , -128, 127, "", "Upper bound"),
+    ("052:LB",   "052", "R", "0-7", "S8"  , -128, 127, "", "Lower bound"),
+    ("053",      "053", "R", ""   , "BF"  , 0, 0, "", "Remote param 5"), # unsure
+    ("053:HB",   "053", "R", "8-15", "S8" , -128, 127, "", "Upper bound"),
+    ("053:LB",   "053", "R", "0-7", "S8"  , -128, 127, "", "Lower bound"),
+    ("054",      "054", "R", ""   , "BF"  , 0, 0, "", "Remote param 6"), # unsure
+    ("054:HB",   "054", "R", "8-15", "S8" , -128, 127, "", "Upper bound"),
+    ("054:LB",   "054", "R", "0-7", "S8"  , -128, 127, "", "Lower bound"),
+    ("055",      "055", "R", ""   , "BF"  , 0, 0, "", "Remote param 7"), # unsure
+    ("055:HB",   "055", "R", "8-15", "S8" , -128, 127, "", "Upper bound"),
+    ("055:LB",   "055", "R", "0-7", "S8"  , -128, 127, "", "Lower bound"),
+    ("056",      "056", "RW", ""  , ""  , 0, 0, "°C", "DHW Setpoint (Remote param 0)"),
+    ("056R",     "056", "R", ""   , "F8.8", 0, 127, "°C", "Current DHW Setpoint (Remote param 0)"),
+    ("056W",     "056", "W", ""   , "F8.8", 0, 127, "°C", "DHW Setpoint to set(Remote param 0)"),
+    ("057",      "057", "RW", ""  , ""  , 0, 0, "°C", "Max CH water Setpoint (Remote param 1)"),
+    ("057R",     "057", "R", ""   , "F8.8", 0, 127, "°C", "Current Max CH water Setpoint (Remote param 1)"),
+    ("057W",     "057", "W", ""   , "F8.8", 0, 127, "°C", "Max CH water Setpoint to set (Remote param 1)"),
+    ("058",      "058", "RW", ""  , ""  , 0, 0, "°C", "OTC HC Ratio (Remote param 2)"), # unsure
+    ("058R",     "058", "R", ""   , "F8.8", 0, 127, "°C", "Current OTC HC Ratio (Remote param 2)"), # unsure
+    ("058W",     "058", "W", ""   , "F8.8", 0, 127, "°C", "OTC HC Ratio to set (Remote param 2)"), # unsure
+    ("059",      "059", "RW", ""  , ""  , 0, 0, "", "(Remote param 3)"),
+    ("059R",     "059", "R", ""   , "F8.8", 0, 127, "", "Current (Remote param 3)"),
+    ("059W",     "059", "W", ""   , "F8.8", 0, 127, "", "to set (Remote param 3)"),
+    ("060",      "060", "RW", ""  , ""  , 0, 0, "", "(Remote param 4)"),
+    ("060R",     "060", "R", ""   , "F8.8", 0, 127, "", "Current (Remote param 4)"),
+    ("060W",     "060", "W", ""   , "F8.8", 0, 127, "", "to set (Remote param 4)"),
+    ("061",      "061", "RW", ""  , ""  , 0, 0, "", "(Remote param 5)"),
+    ("061R",     "061", "R", ""   , "F8.8", 0, 127, "", "Current (Remote param 5)"),
+    ("061W",     "061", "W", ""   , "F8.8", 0, 127, "", "to set (Remote param 5)"),
+    ("062",      "062", "RW", ""  , ""  , 0, 0, "", "(Remote param 6)"),
+    ("062R",     "062", "R", ""   , "F8.8", 0, 127, "", "Current (Remote param 6)"),
+    ("062W",     "062", "W", ""   , "F8.8", 0, 127, "", "to set (Remote param 6)"),
+    ("063",      "063", "RW", ""  , ""  , 0, 0, "", "(Remote param 7)"),
+    ("063R",     "063", "R", ""   , "F8.8", 0, 127, "", "Current (Remote param 7)"),
+    ("063W",     "063", "W", ""   , "F8.8", 0, 127, "", "to set (Remote param 7)"),
+    ("070",      "070", "R", "",    "BF", 0, 0, "", "Status ventilation / heat-recovery"), # unsure
+    ("070:HB0",  "070", "R", "HB0", "BF", 0, 1, "", "Master status ventilation / heat-recovery: Ventilation enable"), # unsure
+    ("070:HB1",  "070", "R", "HB1", "BF", 0, 1, "", "Master status ventilation / heat-recovery: Bypass postion"), # unsure
+    ("070:HB2",  "070", "R", "HB2", "BF", 0, 1, "", "Master status ventilation / heat-recovery: Bypass mode"), # unsure
+    ("070:HB3",  "070", "R", "HB3", "BF", 0, 1, "", "Master status ventilation / heat-recovery: Free ventilation mode"), # unsure
+    ("070:LB0",  "070", "R", "LB0", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Fault indication"), # unsure
+    ("070:LB1",  "070", "R", "LB1", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Ventilation mode"), # unsure
+    ("070:LB2",  "070", "R", "LB2", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Bypass status"), # unsure
+    ("070:LB3",  "070", "R", "LB3", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Bypass automatic status"), # unsure
+    ("070:LB4",  "070", "R", "LB4", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Free ventilation status"), # unsure
+    ("070:LB6",  "070", "R", "LB6", "BF", 0, 1, "", "Slave status ventilation / heat-recovery: Diagnostic indication"), # unsure
+    ("071",      "071", "R", ""   , ""  , 0, 0, "", "Relative ventilation position (0-100%). 0% is the minimum set ventilation and 100% is the maximum set ventilation"), # unsure
+    ("072",      "072", "R", ""   , ""  , 0, 0, "", "Application-specific fault flags and OEM fault code ventilation / heat-recovery"), # unsure
+    ("073",      "073", "R", ""   , ""  , 0, 0, "", "An OEM-specific diagnostic/service code for ventilation / heat-recovery system"), # unsure
+    ("074",      "074", "R", "",    "BF", 0, 1, "", "Slave Configuration ventilation / heat-recovery"), # unsure
+    ("074:HB0",  "074", "R", "HB0", "BF", 0, 1, "", "Ventilation enabled"), # unsure
+    ("074:HB1",  "074", "R", "HB1", "BF", 0, 1, "", "Bypass position"), # unsure
+    ("074:HB2",  "074", "R", "HB2", "BF", 0, 1, "", "Bypass mode"), # unsure
+    ("074:HB3",  "074", "R", "HB3", "BF", 0, 1, "", "Speed control"), # unsure
+    ("074:LB",   "074", "R", "0-7", "U8", 0, 255, "", "Slave MemberID Code ventilation / heat-recovery"), # unsure
 #!!! not properly checked from below
-        self.otd["075"]      = OTData("075", "R", ""   , "U16", 0, 0, "", "The implemented version of the OpenTherm Protocol Specification in the ventilation / heat-recovery system")
-        self.otd["076"]      = OTData("076", "R", ""   , "U16", 0, 0, "", "Ventilation / heat-recovery product version number and type")
-        self.otd["077"]      = OTData("077", "R", ""   , "U16", 0, 100, "%", "Relative ventilation")
-        self.otd["078"]      = OTData("078", "R", ""   , "U16", 0, 100, "%", "Relative humidity exhaust air")
-        self.otd["079"]      = OTData("079", "R", ""   , "U16", 0, 2000, "ppm", "CO2 level exhaust air")
-        self.otd["080"]      = OTData("080", "R", ""   , "U16", 0, 0, "°C", "Supply inlet temperature")
-        self.otd["081"]      = OTData("081", "R", ""   , "U16", 0, 0, "°C", "Supply outlet temperature")
-        self.otd["082"]      = OTData("082", "R", ""   , "U16", 0, 0, "°C", "mExhaust inlet temperature")
-        self.otd["083"]      = OTData("083", "R", ""   , "U16", 0, 0, "°C", "Exhaust outlet temperature")
-        self.otd["084"]      = OTData("084", "R", ""   , "U16", 0, 0, "rpm", "Exhaust fan speed")
-        self.otd["085"]      = OTData("085", "R", ""   , "U16", 0, 0, "rpm", "Supply fan speed")
-        self.otd["086"]      = OTData("086", "R", "",    "BF", 0, 0, "", "Remote ventilation / heat-recovery parameter:")
-        self.otd["086:HB0"]  = OTData("086", "R", "HB0", "BF", 0, 0, "", "Transfer-enable: Nominal ventilation value")
-        self.otd["086:LB0"]  = OTData("086", "R", "LB0", "BF", 0, 0, "", "Read/write : Nominal ventilation value")
-        self.otd["087"]      = OTData("087", "R", ""   , "U16", 0, 100, "%", "Nominal relative value for ventilation")
-        self.otd["088"]      = OTData("088", "R", ""   , "U16", 0, 255, "", "Number of Transparent-Slave-Parameters supported by TSP’s ventilation / heat-recovery")
-        self.otd["089"]      = OTData("089", "R", ""   , "U16", 0, 255, "", "Index number / Value of referred-to transparent TSP’s ventilation / heat-recovery parameter")
-        self.otd["090"]      = OTData("090", "R", ""   , "U16", 0, 255, "", "Size of Fault-History-Buffer supported by ventilation / heat-recovery")
-        self.otd["091"]      = OTData("091", "R", ""   , "U16", 0, 255, "", "Index number / Value of referred-to fault-history buffer entry ventilation / heat-recovery")
+    ("075",      "075", "R", ""   , "U16", 0, 0, "", "The implemented version of the OpenTherm Protocol Specification in the ventilation / heat-recovery system"),
+    ("076",      "076", "R", ""   , "U16", 0, 0, "", "Ventilation / heat-recovery product version number and type"),
+    ("077",      "077", "R", ""   , "U16", 0, 100, "%", "Relative ventilation"),
+    ("078",      "078", "R", ""   , "U16", 0, 100, "%", "Relative humidity exhaust air"),
+    ("079",      "079", "R", ""   , "U16", 0, 2000, "ppm", "CO2 level exhaust air"),
+    ("080",      "080", "R", ""   , "U16", 0, 0, "°C", "Supply inlet temperature"),
+    ("081",      "081", "R", ""   , "U16", 0, 0, "°C", "Supply outlet temperature"),
+    ("082",      "082", "R", ""   , "U16", 0, 0, "°C", "mExhaust inlet temperature"),
+    ("083",      "083", "R", ""   , "U16", 0, 0, "°C", "Exhaust outlet temperature"),
+    ("084",      "084", "R", ""   , "U16", 0, 0, "rpm", "Exhaust fan speed"),
+    ("085",      "085", "R", ""   , "U16", 0, 0, "rpm", "Supply fan speed"),
+    ("086",      "086", "R", "",    "BF", 0, 0, "", "Remote ventilation / heat-recovery parameter:"),
+    ("086:HB0",  "086", "R", "HB0", "BF", 0, 0, "", "Transfer-enable: Nominal ventilation value"),
+    ("086:LB0",  "086", "R", "LB0", "BF", 0, 0, "", "Read/write : Nominal ventilation value"),
+    ("087",      "087", "R", ""   , "U16", 0, 100, "%", "Nominal relative value for ventilation"),
+    ("088",      "088", "R", ""   , "U16", 0, 255, "", "Number of Transparent-Slave-Parameters supported by TSP’s ventilation / heat-recovery"),
+    ("089",      "089", "R", ""   , "U16", 0, 255, "", "Index number / Value of referred-to transparent TSP’s ventilation / heat-recovery parameter"),
+    ("090",      "090", "R", ""   , "U16", 0, 255, "", "Size of Fault-History-Buffer supported by ventilation / heat-recovery"),
+    ("091",      "091", "R", ""   , "U16", 0, 255, "", "Index number / Value of referred-to fault-history buffer entry ventilation / heat-recovery"),
 # from https://www.opentherm.eu/request-details/?post_ids=3931
-        self.otd["093"]      = OTData("093", "R", ""   , "U16", 0, 65535, "", "Brand Index / Slave Brand name")
-        self.otd["094"]      = OTData("094", "R", ""   , "U16", 0, 65535, "", "Brand Version Index / Slave product type/version")
-        self.otd["095"]      = OTData("095", "R", ""   , "U16", 0, 65535, "", "Brand Serial Number index / Slave product serialnumber")
-        self.otd["098"]      = OTData("098", "R", ""   , "U16", 0, 255, "", "For a specific RF sensor the RF strength and battery level is written")
-        self.otd["099"]      = OTData("099", "R", ""   , "U16", 0, 255, "", "Operating Mode HC1, HC2/ Operating Mode DHW")
+    ("093",      "093", "R", ""   , "U16", 0, 65535, "", "Brand Index / Slave Brand name"),
+    ("094",      "094", "R", ""   , "U16", 0, 65535, "", "Brand Version Index / Slave product type/version"),
+    ("095",      "095", "R", ""   , "U16", 0, 65535, "", "Brand Serial Number index / Slave product serialnumber"),
+    ("098",      "098", "R", ""   , "U16", 0, 255, "", "For a specific RF sensor the RF strength and battery level is written"),
+    ("099",      "099", "R", ""   , "U16", 0, 255, "", "Operating Mode HC1, HC2/ Operating Mode DHW"),
 # to check
-        self.otd["100"]      = OTData("100", "R", ""   , "U16", 0, 255, "", "Function of manual and program changes in master and remote room Setpoint")
-        self.otd["101"]      = OTData("101", "R", ""   , "BF", 0, 0, "", "Solar Storage:")
-        self.otd["101:HB"]   = OTData("101", "R", "8-10", "U8", 0, 0, "", "Master Solar Storage: Solar mode")
-        self.otd["101:LB0"]  = OTData("101", "R", "LB0", "BF", 0, 0, "", "Slave Solar Storage: Fault indication")
-        self.otd["101:LB1"]  = OTData("101", "R", "1-3", "U8", 0, 7, "", "Slave Solar Storage: Solar mode status")
-        self.otd["101:LB2"]  = OTData("101", "R", "4-5", "U8", 0, 3, "", "Slave Solar Storage: Solar status")
-        self.otd["102"]      = OTData("102", "R", ""   , ""  , 0, 0, "", "Application-specific fault flags and OEM fault code Solar Storage")
-        self.otd["103"]      = OTData("103", "R", "",    "BF", 0, 0, "", "Slave Configuration Solar Storage")
-        self.otd["103:HB0"]  = OTData("103", "R", "HB0", "BF", 0, 0, "", "System type")
-        self.otd["103:LB"]   = OTData("103", "R", "0-7", "U8", 0, 255, "", "Slave MemberID")
-        self.otd["104"]      = OTData("104", "R", ""   , "U16", 0, 255, "", "Solar Storage product version number and type")
-        self.otd["105"]      = OTData("105", "R", ""   , "U16", 0, 255, "", "Number of Transparent-Slave-Parameters supported by TSP’s Solar Storage")
-        self.otd["106"]      = OTData("106", "R", ""   , "U16", 0, 255, "", "Index number / Value of referred-to transparent TSP’s Solar Storage parameter")
-        self.otd["107"]      = OTData("107", "R", ""   , "U16", 0, 255, "", "Size of Fault-History-Buffer supported by Solar Storage")
-        self.otd["108"]      = OTData("108", "R", ""   , "U16", 0, 255, "", "Index number / Value of referred-to fault-history buffer entry Solar Stor")
-        self.otd["109"]      = OTData("109", "R", ""   , "U16", 0, 255, "", "Electricity producer starts")
-        self.otd["110"]      = OTData("110", "R", ""   , "U16", 0, 255, "", "Electricity producer hours")
-        self.otd["111"]      = OTData("111", "R", ""   , "U16", 0, 255, "", "Electricity production")
-        self.otd["112"]      = OTData("112", "R", ""   , "U16", 0, 255, "", "Cumulativ Electricity production")
-        self.otd["113"]      = OTData("113", "R", ""   , "U16", 0, 255, "", "Number of un-successful burner starts")
-        self.otd["114"]      = OTData("114", "R", ""   , "U16", 0, 255, "", "Number of times flame signal was too low")
+    ("100",      "100", "R", ""   , "U16", 0, 255, "", "Function of manual and program changes in master and remote room Setpoint"),
+    ("101",      "101", "R", ""   , "BF", 0, 0, "", "Solar Storage:"),
+    ("101:HB",   "101", "R", "8-10", "U8", 0, 0, "", "Master Solar Storage: Solar mode"),
+    ("101:LB0",  "101", "R", "LB0", "BF", 0, 0, "", "Slave Solar Storage: Fault indication"),
+    ("101:LB1",  "101", "R", "1-3", "U8", 0, 7, "", "Slave Solar Storage: Solar mode status"),
+    ("101:LB2",  "101", "R", "4-5", "U8", 0, 3, "", "Slave Solar Storage: Solar status"),
+    ("102",      "102", "R", ""   , ""  , 0, 0, "", "Application-specific fault flags and OEM fault code Solar Storage"),
+    ("103",      "103", "R", "",    "BF", 0, 0, "", "Slave Configuration Solar Storage"),
+    ("103:HB0",  "103", "R", "HB0", "BF", 0, 0, "", "System type"),
+    ("103:LB",   "103", "R", "0-7", "U8", 0, 255, "", "Slave MemberID"),
+    ("104",      "104", "R", ""   , "U16", 0, 255, "", "Solar Storage product version number and type"),
+    ("105",      "105", "R", ""   , "U16", 0, 255, "", "Number of Transparent-Slave-Parameters supported by TSP’s Solar Storage"),
+    ("106",      "106", "R", ""   , "U16", 0, 255, "", "Index number / Value of referred-to transparent TSP’s Solar Storage parameter"),
+    ("107",      "107", "R", ""   , "U16", 0, 255, "", "Size of Fault-History-Buffer supported by Solar Storage"),
+    ("108",      "108", "R", ""   , "U16", 0, 255, "", "Index number / Value of referred-to fault-history buffer entry Solar Stor"),
+    ("109",      "109", "R", ""   , "U16", 0, 255, "", "Electricity producer starts"),
+    ("110",      "110", "R", ""   , "U16", 0, 255, "", "Electricity producer hours"),
+    ("111",      "111", "R", ""   , "U16", 0, 255, "", "Electricity production"),
+    ("112",      "112", "R", ""   , "U16", 0, 255, "", "Cumulativ Electricity production"),
+    ("113",      "113", "R", ""   , "U16", 0, 255, "", "Number of un-successful burner starts"),
+    ("114",      "114", "R", ""   , "U16", 0, 255, "", "Number of times flame signal was too low"),
 # below data-ids are checked up against specs
-        self.otd["115"]      = OTData("115", "R", ""   , "U16", 0, 255, "", "OEM-specific diagnostic/service code")
-        # below ids are RW (write 0 to reset)
-        self.otd["116"]      = OTData("116", "R", ""   , "U16", 0, 65535, "", "Number of succesful starts burner")
-        self.otd["117"]      = OTData("117", "R", ""   , "U16", 0, 65535, "", "Number of starts CH pump")
-        self.otd["118"]      = OTData("118", "R", ""   , "U16", 0, 65535, "", "Number of starts DHW pump/valve")
-        self.otd["119"]      = OTData("119", "R", ""   , "U16", 0, 65535, "", "Number of starts burner during DHW mode")
-        self.otd["120"]      = OTData("120", "R", ""   , "U16", 0, 65535, "", "Number of hours that burner is in operation (i.e. flame on)")
-        self.otd["121"]      = OTData("121", "R", ""   , "U16", 0, 65535, "", "Number of hours that CH pump has been running")
-        self.otd["122"]      = OTData("122", "R", ""   , "U16", 0, 65535, "", "Number of hours that DHW pump has been running or DHW valve has been opened")
-        self.otd["123"]      = OTData("123", "R", ""   , "U16", 0, 65535, "", "Number of hours that burner is in operation during DHW mode")
-        # ^^^
-        self.otd["124"]      = OTData("124", "W", ""   , "F8.8", 1, 127, "", "The implemented version of the OpenTherm Protocol Specification in the master")
-        self.otd["125"]      = OTData("125", "R", ""   , "F8.8", 1, 127, "", "The implemented version of the OpenTherm Protocol Specification in the slave")
-        self.otd["126"]      = OTData("126", "W", ""   , "BF"  , 0, 0, "", "Master product version number and type")
-        self.otd["126:HB"]   = OTData("126", "W", "8-15", "U8"  , 0, 255, "", "Master product version number and type")
-        self.otd["126:LB"]   = OTData("126", "W", "0-7", "U8"  , 0, 255, "", "Master product version number and type")
-        self.otd["127"]      = OTData("127", "R", ""   , "BF"  , 0, 0, "", "Slave product version number and type")
-        self.otd["127:HB"]   = OTData("127", "R", "8-15", "U8"  , 0, 255, "", "Slave product version number and type")
-        self.otd["127:LB"]   = OTData("127", "R", "0-7", "U8"  , 0, 255, "", "Slave product version number and type")
+    ("115",      "115", "R", ""   , "U16", 0, 255, "", "OEM-specific diagnostic/service code"),
+    # below ids are RW (write 0 to reset)
+    ("116",      "116", "R", ""   , "U16", 0, 65535, "", "Number of succesful starts burner"),
+    ("117",      "117", "R", ""   , "U16", 0, 65535, "", "Number of starts CH pump"),
+    ("118",      "118", "R", ""   , "U16", 0, 65535, "", "Number of starts DHW pump/valve"),
+    ("119",      "119", "R", ""   , "U16", 0, 65535, "", "Number of starts burner during DHW mode"),
+    ("120",      "120", "R", ""   , "U16", 0, 65535, "", "Number of hours that burner is in operation (i.e. flame on)"),
+    ("121",      "121", "R", ""   , "U16", 0, 65535, "", "Number of hours that CH pump has been running"),
+    ("122",      "122", "R", ""   , "U16", 0, 65535, "", "Number of hours that DHW pump has been running or DHW valve has been opened"),
+    ("123",      "123", "R", ""   , "U16", 0, 65535, "", "Number of hours that burner is in operation during DHW mode"),
+    # ^^^
+    ("124",      "124", "W", ""   , "F8.8", 1, 127, "", "The implemented version of the OpenTherm Protocol Specification in the master"),
+    ("125",      "125", "R", ""   , "F8.8", 1, 127, "", "The implemented version of the OpenTherm Protocol Specification in the slave"),
+    ("126",      "126", "W", ""   , "BF"  , 0, 0, "", "Master product version number and type"),
+    ("126:HB",   "126", "W", "8-15", "U8"  , 0, 255, "", "Master product version number and type"),
+    ("126:LB",   "126", "W", "0-7", "U8"  , 0, 255, "", "Master product version number and type"),
+    ("127",      "127", "R", ""   , "BF"  , 0, 0, "", "Slave product version number and type"),
+    ("127:HB",   "127", "R", "8-15", "U8"  , 0, 255, "", "Slave product version number and type"),
+    ("127:LB",   "127", "R", "0-7", "U8"  , 0, 255, "", "Slave product version number and type"),
 # baxi ecofour unspecified regs
-        self.otd["129"]      = OTData("129", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 129")
-        self.otd["130"]      = OTData("130", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 130")
-        self.otd["131"]      = OTData("131", "R", ""   , "BF", 0, 0, "", "Remeha codes:")
-        self.otd["131:HB"]   = OTData("131", "R", "8-15", "U8", 0, 255, "", "dU")
-        self.otd["131:LB"]   = OTData("131", "R", "0-7", "U8", 0, 255, "", "dF")
-        self.otd["132"]      = OTData("132", "R", ""   , "BF", 0, 0, "", "Remeha Servicemessage:")
-        self.otd["132:HB"]   = OTData("132", "R", "8-15", "U8", 0, 255, "", "Next service type")
-        self.otd["132:LB"]   = OTData("132", "R", "0-7", "U8", 0, 255, "", "?")
-        self.otd["133"]      = OTData("133", "W", ""   , "U16", 0, 511, "", "Remeha detection connected SCU’s")
-        self.otd["149"]      = OTData("149", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 149")
-        self.otd["150"]      = OTData("150", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 150")
-        self.otd["151"]      = OTData("151", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 151")
-        self.otd["173"]      = OTData("173", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 173")
-        self.otd["198"]      = OTData("198", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 198")
-        self.otd["199"]      = OTData("199", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 199")
-        self.otd["200"]      = OTData("200", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 200")
-        self.otd["202"]      = OTData("202", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 202")
-        self.otd["203"]      = OTData("203", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 203")
-        self.otd["204"]      = OTData("204", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 204")
-        self.otd["209"]      = OTData("209", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 209")
-
-
-        # from https://otgw.tclcode.com/details.cgi
-        self.OT_MEMBERS = { 
-            0: "Unspecified",
-            2: "AWB",
-            4: "Multibrand", # Atag, Baxi Slim, Brötje, Elco
-            5: "Itho Daalderop",
-            6: "Daikin/Ideal",
-            8: "Biasi/Buderus/Logamax", 
-            9: "Ferroli/Agpo",
-            11: "De Dietrich/Remeha/Baxi Prime", 
-            13: "Cetetherm",
-            16: "Unical",
-            18: "Bosch",
-            24: "Vaillant/AWB/Bulex", 
-            27: "Baxi",
-            29: "Daalderop/Itho",
-            33: "Viessmann",
-            41: "Radiant",
-            56: "Baxi Luna",
-            131: "Netfit/Bosch",
-            173: "Intergas"
-        }
+    ("129",      "129", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 129"),
+    ("130",      "130", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 130"),
+    ("131",      "131", "R", ""   , "BF", 0, 0, "", "Remeha codes:"),
+    ("131:HB",   "131", "R", "8-15", "U8", 0, 255, "", "dU"),
+    ("131:LB",   "131", "R", "0-7", "U8", 0, 255, "", "dF"),
+    ("132",      "132", "R", ""   , "BF", 0, 0, "", "Remeha Servicemessage:"),
+    ("132:HB",   "132", "R", "8-15", "U8", 0, 255, "", "Next service type"),
+    ("132:LB",   "132", "R", "0-7", "U8", 0, 255, "", "?"),
+    ("133",      "133", "W", ""   , "U16", 0, 511, "", "Remeha detection connected SCU’s"),
+    ("149",      "149", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 149"),
+    ("150",      "150", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 150"),
+    ("151",      "151", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 151"),
+    ("173",      "173", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 173"),
+    ("198",      "198", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 198"),
+    ("199",      "199", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 199"),
+    ("200",      "200", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 200"),
+    ("202",      "202", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 202"),
+    ("203",      "203", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 203"),
+    ("204",      "204", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 204"),
+    ("209",      "209", "R", ""   , "U16", 0, 65535, "", "BAXI data-id 209"),
+)
+
+# otd must keep the table order (scan walks it); builtin dict does so since python 3.7
+OTDict = dict if sys.version_info >= (3, 7) else collections.OrderedDict
+
+
+# (numeric data-id, "R"/"W") -> (otd key describing it, description prefix for RW data-ids)
+def build_decode_map(otd):
+    decode_map = {}
+    for key, d in otd.items():
+        if len(key) == 3:
+            for t_dir in ("R", "W"):
+                if d.t_dir == "RW":
+                    decode_map[(int(key), t_dir)] = (key + t_dir, d.descr + ": ")
+                else:
+                    decode_map[(int(key), t_dir)] = (key, "")
+    return decode_map
+
+# bitfield sub-records in the order they are reported
+OT_BF_VARIANTS = ( "HB", "HB0", "HB1", "HB2", "HB3", "HB4", "HB5", "HB6", "HB7", "LB", "LB0", "LB1", "LB2", "LB3", "LB4", "LB5", "LB6", "LB7" )
+
+# parent otd key -> tuple of (variant otd key, OTData) of its bitfield sub-records
+def build_variants(otd):
+    variants = {}
+    for key, d in otd.items():
+        if ":" in key:
+            parent, variant = key.split(":")
+            variants.setdefault(parent, []).append((OT_BF_VARIANTS.index(variant), key, d))
+    return { parent: tuple((key, d) for _, key, d in sorted(v, key=lambda x: x[0])) for parent, v in variants.items() }
+
+# decoder table and lookups are built once at import and shared by all decoders;
+# read-only view of the table, keys are interned so lookups with them hit the identity fast path
+OTD = types.MappingProxyType(OTDict((sys.intern(key), OTData(*row)) for key, *row in OT_DATA_TABLE))
+OTD_DECODE_MAP = build_decode_map(OTD)
+OTD_VARIANTS = build_variants(OTD)
+
+# from https://otgw.tclcode.com/details.cgi
+OT_MEMBERS = { 
+    0: "Unspecified",
+    2: "AWB",
+    4: "Multibrand", # Atag, Baxi Slim, Brötje, Elco
+    5: "Itho Daalderop",
+    6: "Daikin/Ideal",
+    8: "Biasi/Buderus/Logamax", 
+    9: "Ferroli/Agpo",
+    11: "De Dietrich/Remeha/Baxi Prime", 
+    13: "Cetetherm",
+    16: "Unical",
+    18: "Bosch",
+    24: "Vaillant/AWB/Bulex", 
+    27: "Baxi",
+    29: "Daalderop/Itho",
+    33: "Viessmann",
+    41: "Radiant",
+    56: "Baxi Luna",
+    131: "Netfit/Bosch",
+    173: "Intergas"
+}
+# bitfield sub-records holding a member id
+OT_MEMBER_IDS = frozenset(("002:LB", "003:LB", "074:LB", "103:LB"))
+
+# opentherm data-value encoders by parse_val number format ("<number>%<fmt>[<lo>[-<hi>]]"): (number, lo, hi) -> 16-bit value
+def pack_f88(vn, lo, hi): # float %8.8f, '~' is for negative numbers
+    if lo is not None:
+        raise ValueError("No bit position allowed for \'F8.8\'")
+    if "~" == vn[0:1]:
+        nf = -float(vn[1:])
+    else:
+        nf = float(vn)
+    if abs(nf) == float("inf"):
+        raise ValueError("Invalid opentherm F8.8 value \'" + vn + "\'")
+    return int(nf * 256) & 0xffff
+
+def pack_bits(vn, lo, hi): # 16bit word's bit %B<N> or bitrange %B<N>-<M>
+    if lo is None:
+        raise ValueError("No opentherm bit position for \'B\'")
+    n = int(vn)
+    bl = int(lo)
+    if bl > 15:
+        raise ValueError("Invalid opentherm bit position \'B%s\'" % lo)
+    if hi is None:
+        return (n & 1) << bl
+    bh = int(hi)
+    if bh < bl or bh > 15:
+        raise ValueError("Invalid opentherm bit range \'B%s-%s\'" % (lo, hi))
+    return (n & ((1 << (bh - bl + 1)) - 1)) << bl
+
+# bit number within the byte for %HB<N>/%LB<N> (0 for the whole byte)
+def pack_byte_bit(byte, lo, hi):
+    if hi is not None or (lo is not None and int(lo) > 7):
+        raise ValueError("Invalid opentherm bit position for \'%s\'" % byte)
+    return 0 if lo is None else int(lo)
+
+def pack_hb(vn, lo, hi): # 8bit high byte or numbered bit %HB<N>
+    return (int(vn) & 255) << (8 + pack_byte_bit("HB", lo, hi))
+
+def pack_lb(vn, lo, hi): # 8bit low byte or numbered bit %LB<N>
+    return (int(vn) & 255) << pack_byte_bit("LB", lo, hi)
+
+# format name with optional bit/bitrange suffix: F8.8, B<N>, B<N>-<M>, HB, HB<N>, LB, LB<N>
+PACK_FMT_RE = re.compile(r"(F8\.8|B|HB|LB)(?:(\d+)(?:-(\d+))?)?$")
+PACK_HANDLERS = {
+    "F8.8": pack_f88,
+    "B": pack_bits,
+    "HB": pack_hb,
+    "LB": pack_lb,
+}
 
 
+class OTDecoder:
+    # shared read-only tables (nothing to set up per decoder)
+    otd = OTD
+    decode_map = OTD_DECODE_MAP
+    variants = OTD_VARIANTS
+    OT_MEMBERS = OT_MEMBERS
+
     # return opentherm master-to-slave and slave-to-master message names by numeric id
     def msg_descr(self, resp):
         if resp < 0 or resp > 7:
             return "!LAME!"
         else:
-            return self.OT_MSGS[resp]
-
-    # extract response bits based on otd descriptions of data position
-    def get_bits(self, value, pos):
-        if pos[0:2] == "LB":
-            return (value >> int(pos[2])) & 1
-        elif pos[0:2] == "HB":
-            return (value >> (8+int(pos[2]))) & 1
-        else:
-            iv = pos.split("-")
-            mask = 0
-            for i in range(0, int(iv[1]) - int(iv[0]) + 1):
-                mask = (mask << 1) | 1
-            return (value >> int(iv[0])) & mask
-    
-    # decode opentherm data-value based on it's pos and fmt; 
-    # return: ( string representation, 1 if success else -1 )
-    def decode_value(self, value, fmt, pos):
-        if fmt == "U8" or fmt == "BF":
-            if pos != "":
-                v = self.get_bits(value, pos) & 0xff
-            else:
-                v  = (value & 0xff)
-            return "%u" % v, 1
-        elif fmt == "U16":
-            return "%u" % (value & 0xffff), 1
-        elif fmt == "S8":
-            if pos != "":
-                v = self.get_bits(value, pos) & 0xff
-            else:
-                v = value & 0xff
-            if v > 127:
-                return "-%u" % (256 - v), 1
-            else:
-                return "%u" % v, 1
-        elif fmt == "S16":
-            if value > 32767:
-                return "-%u" % (65536 - (value & 0xffff)), 1
-            else:
-                return "%u" % (value & 0xffff), 1
-        elif fmt == "F8.8": # # 1/256 gives 0.00390625 i.e. 8 fractional decimal digits but it useless in this certain practical case, let's limit output to 3 decimal digits to get something out of smallest possible number
-            v = value & 0xffff
-            if v > 32767:
-                return ("-%.3f" % ((65536-v)/256)).rstrip('0').rstrip('.'), 1 # default %f formatting produces extra trailing zeroes
-            else:
-                return ("%.3f" % (v/256)).rstrip('0').rstrip('.'), 1
-        else:
+            return OT_MSGS[resp]
+
+    # decode opentherm data-value based on it's fmt and pos (as precomputed OTData shift/mask); 
+    # return: ( string representation, numeric value, 1 if success else -1 )
+    def decode_value(self, value, d):
+        if d.decode is None:
             # unknown format
-            return "###", -1
-
-    # decode description string (if it has conditional parts separated by ';')
-    def decode_descr(self, descr, val):
-        if ';' not in descr:
-            return descr;
-        ds = descr.split(';')
-        for d in ds:
-            c  = d.split(' ', 1)
-            if eval(val + c[0]):
-                return c[1]
+            return "###", None, -1
+        vs, vn = d.decode(value, d.shift, d.mask)
+        return vs, vn, 1
+
+    # decode description of OTData (if it has conditional parts separated by ';')
+    def decode_descr(self, d, val, vn):
+        if d.conds is None:
+            return d.descr
+        for op, n, text in d.conds:
+            if op(vn, n):
+                return text
         return "unknown value " + val
 
     # decode and describe opentherm data-value using direct otd[] lookup by dids
+    # results only depend on the (read-only) tables, repeated polls of the same value are served from cache
+    @functools.lru_cache(maxsize=1024)
     def describe_dataid(self, dids, val):
-        descr = ""
-        if self.otd[dids].fmt == "BF":
-            descr = self.otd[dids].descr
-            for variant in ( "HB", "HB0", "HB1", "HB2", "HB3", "HB4", "HB5", "HB6", "HB7", "LB", "LB0", "LB1", "LB2", "LB3", "LB4", "LB5", "LB6", "LB7" ):
-                varid = dids + ":" + variant
-                if varid in self.otd:
-                    vv, vc = self.decode_value(val, self.otd[varid].fmt, self.otd[varid].pos)
-                    if vc > 0:
-                        if '-' in self.otd[varid].pos: # multibit field
-                            descr = descr + "\n " + self.decode_descr(self.otd[varid].descr, vv) + " = " + vv + self.otd[varid].units
-                            if float(vv) < self.otd[varid].min or float(vv) > self.otd[varid].max:
-                                descr = descr + " - out of range!"
-                        else:
-                            descr = descr + "\n " + ("+" if vv == "1" else "-") + self.otd[varid].descr
-                        if varid == "003:LB" or varid == "002:LB" or varid == "074:LB" or varid == "103:LB":
-                            descr = descr + " (" + self.describe_member(int(vv)) + ")"
+        rec = self.otd[dids]
+        if rec.fmt == "BF":
+            parts = [rec.descr]
+            for varid, vrec in self.variants.get(dids, ()):
+                vv, vn, vc = self.decode_value(val, vrec)
+                if vc > 0:
+                    if '-' in vrec.pos: # multibit field
+                        line = " " + self.decode_descr(vrec, vv, vn) + " = " + vv + vrec.units
+                        if vn < vrec.min or vn > vrec.max:
+                            line += " - out of range!"
                     else:
-                        return "Unable to decode value \'" + val + "\' as per fmt " + self.otd[varid].fmt + " from pos " +  self.otd[varid].pos , -1
+                        line = " " + ("+" if vn == 1 else "-") + vrec.descr
+                    if varid in OT_MEMBER_IDS:
+                        line += " (" + self.describe_member(vn) + ")"
+                    parts.append(line)
+                else:
+                    return "Unable to decode value \'%d\' as per fmt %s from pos %s" % (val, vrec.fmt, vrec.pos), -1
         else:
-            v,c = self.decode_value(val, self.otd[dids].fmt, self.otd[dids].pos)
+            v, vn, c = self.decode_value(val, rec)
             if c < 0:
-                return "Unable to decode value \'" + val + "\' as per fmt " + self.otd[dids].fmt + " from pos " +  self.otd[dids].pos , -1
-            descr = self.decode_descr(self.otd[dids].descr, v) + "\n " + v + self.otd[dids].units
-            if float(v) < self.otd[dids].min or float(v) > self.otd[dids].max:
-                descr = descr + " - out of range!"
-        return descr, 1
-
-
-    # describe either read or write opentherm request/response
-    def describe_param_internal(self, dids, t_dir, val_sent, val_received, do_print):
-        descr = ""
-        if not dids in self.otd:
-            if do_print:
-                print("Data-id " + dids + " is unknown")
-            return "Unknown data-id", -3
-        if not t_dir in self.otd[dids].t_dir:
-            if do_print:
-                print("Data-id " + dids + "/" + t_dir + " is unknown")
-            return "Unknown data-id direction", -3
-
+                return "Unable to decode value \'%d\' as per fmt %s from pos %s" % (val, rec.fmt, rec.pos), -1
+            line = " " + v + rec.units
+            if vn < rec.min or vn > rec.max:
+                line += " - out of range!"
+            parts = [self.decode_descr(rec, v, vn), line]
+        return "\n".join(parts), 1
+
+
+    # describe either read or write opentherm request/response;
+    # return: ( description, rc, text to print in verbose mode or None ); pure, so it is cached (printing is up to describe_param)
+    @functools.lru_cache(maxsize=1024)
+    def describe_param_internal(self, dids, t_dir, val_sent, val_received):
+        rec = self.otd.get(dids)
+        if rec is None:
+            return "Unknown data-id", -3, "Data-id " + dids + " is unknown"
+        rec_t_dir = rec.t_dir
+        if not t_dir in rec_t_dir:
+            return "Unknown data-id direction", -3, "Data-id " + dids + "/" + t_dir + " is unknown"
+
+        parts = []
         if t_dir == "R":
-            if "I" in self.otd[dids].t_dir:
-                descr = descr + "Read input value:\n"
+            if "I" in rec_t_dir:
                 vv2, vc2 = self.describe_dataid(dids + "I", val_sent)
                 if vc2 < 0:
-                    return vv2, vc2
-                descr = descr + vv2 + "\n"
+                    return vv2, vc2, None
+                parts += ("Read input value:", vv2)
             vv, vc = self.describe_dataid(dids, val_received)
             if vc < 0:
-                return vv, vc
-            descr = descr + "Response:\n" + vv
+                return vv, vc, None
+            parts += ("Response:", vv)
         else: # assume "W"
-           vv, vc = self.describe_dataid(dids, val_sent)
-           if vc < 0:
-                return vv, vc
-           descr = descr + "Written:\n" + vv + "\n"
-           if "O" in self.otd[dids].t_dir:
-                descr = descr + "Write output value:\n"
+            vv, vc = self.describe_dataid(dids, val_sent)
+            if vc < 0:
+                return vv, vc, None
+            parts += ("Written:", vv)
+            if "O" in rec_t_dir:
                 vv2, vc2 = self.describe_dataid(dids + "I", val_received)
                 if vc2 < 0:
-                    return vv2, vc2
-                descr = descr + vv2
-        if do_print:
-            print(descr)
-        return descr, 1
+                    return vv2, vc2, None
+                parts += ("Write output value:", vv2)
+            else:
+                parts.append("")
+        descr = "\n".join(parts)
+        return descr, 1, descr
 
     # most generic opentherm request/response decoder
     def describe_param(self, data_id, t_dir, value_sent, value_received, do_print=False):
-        if value_sent is int:
-            vsn = value_sent
-        else:
-            try:
-                vsn = int(value_sent)
-            except:
-                if do_print:
-                    print("Value \'" + value_sent + "\' is not a number")
-                return "NaN", -2
-        if value_received is int:
-            vrn = value_received
-        else:
-            try:
-                vrn = int(value_received)
-            except:
-                if do_print:
-                    print("Value \'" + value_received + "\' is not a number")
-                return "NaN", -2
-        if type(data_id) is int:
-            dids = "%03d" % data_id
-        if type(data_id) is str:
-            dids = ("00" + data_id)[-3:]
-        if not dids in self.otd:
+        try:
+            cv = value_sent # for error reporting
+            vsn = value_sent if isinstance(value_sent, int) else int(value_sent)
+            cv = value_received
+            vrn = value_received if isinstance(value_received, int) else int(value_received)
+        except (TypeError, ValueError):
             if do_print:
-                print("Data-id " + dids + " is unknown")
-            return "Unknown data-id", -3
-        if self.otd[dids].t_dir == "RW":
-            r, c = self.describe_param_internal(dids + t_dir, t_dir, vsn, vrn, do_print)
-            return self.otd[dids].descr + ": " + r, c
-        return self.describe_param_internal(dids, t_dir, vsn, vrn, do_print)
+                print("Value \'%s\' is not a number" % cv)
+            return "NaN", -2
+        if not isinstance(data_id, int):
+            data_id = int(data_id)
+        dm = self.decode_map.get((data_id, t_dir))
+        if dm is None: # let describe_param_internal report unknown data-id/direction
+            r, c, pr = self.describe_param_internal("%03d" % data_id, t_dir, vsn, vrn)
+        else:
+            r, c, pr = self.describe_param_internal(dm[0], t_dir, vsn, vrn)
+            if dm[1] != "":
+                r = dm[1] + r
+        if do_print and pr is not None:
+            print(pr)
+        return r, c
 
     def describe_member(self, member_id):
-        if member_id in self.OT_MEMBERS:
-            return self.OT_MEMBERS[member_id]
-        else:
-            return "UNKNOWN"
+        return self.OT_MEMBERS.get(member_id, "UNKNOWN")
          
     def parse_val(self, val):
-        vn = ""
-        if "+" in val:
-            vals = val.split('+')
-            sum = 0
-            for v in vals:
-                sum = sum + self.parse_val(v)
-            return sum & 0xffff
-        cv = "?" # for exception reporting
         try:
-            if "%" in val:
-                v = val.split('%')
-                vn = v[0]
-                if v[1] == "F8.8": # float %8.8f
-                    cv = v[0]
-                    if "~" == cv[0:1]:
-                        nf = -float(cv[1:])
-                    else: 
-                        nf = float(cv)
-                    nf = nf * 256
-                    n = int(nf)
-                    return n & 0xffff
-                elif v[1][0:1] == "B": # 16bit word's bit %B<N> or bitrange %B<N>-<M>
-                    cv = vn
-                    n = int(cv)
-                    if "-" in v[1]:
-                        br = v[1][1:].split('-')
-                        vn = br[0]
-                        cv = vn
-                        bl = int(cv)
-                        vn = br[1]
-                        cv = vn
-                        bh = int(cv)
-                        mask = 0
-                        for i in range(0, (bh - bl) + 1):
-                            mask = (mask << 1) | 1
-                        return (n & mask) << bl
-                    else:
-                        n = n & 1
-                        vn = v[1][1:]
-                        cv = vn
-                        b = int(cv)
-                        return n << b
-                elif v[1][0:2] == "HB": # 8bit high byte or numbered bit %HB<N>
-                    if v[1][2:3].isdigit:
-                        cv = v[1][2:3]
-                        bn = int(cv)
-                        cv = vn
-                        return (int(cv) & 255) << (8 + bn)
-                    cv = vn
-                    return (int(cv) & 255) << 8
-                elif v[1][0:2] == "LB": # 8bit low byte or numbered bit %LB<N>
-                    if v[1][2:3].isdigit:
-                        cv = v[1][2:3]
-                        bn = int(cv)
-                        cv = vn
-                        return (int(cv) & 255) << (bn)
-                    cv = vn
-                    return (int(cv) & 255)
-                else:
-                    raise ValueError("Invalid opentherm number format \'" + v[1] + "\'")
-            cv = val # pure number
-            n = int(cv)
-            return n
-        except:
-            logging.error("Invalid numeric value \'" + cv + "\'")
+            return self.parse_val_cached(val)
+        except ValueError:
+            logging.error("Invalid numeric value \'%s\'", val)
             raise
 
+    # the same few values ("0", special prms) recur on every scan; failures are not cached
+    @functools.lru_cache(maxsize=256)
+    def parse_val_cached(self, val):
+        if val.isdecimal(): # plain non-negative number (the usual case)
+            return int(val, 10)
+        if "+" in val:
+            return sum(self.parse_val_cached(v) for v in val.split('+')) & 0xffff
+        if "%" in val:
+            v = val.split('%')
+            m = PACK_FMT_RE.match(v[1])
+            if not m:
+                raise ValueError("Invalid opentherm number format \'" + v[1] + "\'")
+            return PACK_HANDLERS[m.group(1)](v[0], m.group(2), m.group(3))
+        return int(val, 10) # pure number
+
 
 ##############
 #
 # Nevoton's module interaction generic interface
 #
 class Reply:
-    def __init__(self, arrivalTime, replyTopic, replyData):
+    __slots__ = ("arrivalTime", "replyTopic", "replyData", "kind", "replyStr", "replyNum")
+
+    def __init__(self, arrivalTime, replyTopic, replyData, kind=NCTL_KIND_UNKNOWN):
         self.arrivalTime = arrivalTime
         self.replyTopic = replyTopic
         self.replyData = replyData
+        self.kind = kind        # NCTL_KIND_* of replyTopic
+        self.replyStr = replyData.decode("utf-8", "replace")
+        try:
+            self.replyNum = int(self.replyStr)  # replies are compared as numbers, None if not a number
+        except ValueError:
+            self.replyNum = None
+
+# Replies inbox for the single producer (mqtt thread) / single consumer (send_cmd) case:
+# deque append/popleft are atomic, so an Event for wake-ups is all the locking needed (queue.Queue is much heavier).
+# Mimics queue.Queue interface (raises queue.Empty)
+class ReplyQueue:
+    def __init__(self):
+        self.items = collections.deque()
+        self.ready = threading.Event()
+
+    def put(self, item):
+        self.items.append(item)
+        self.ready.set()
+
+    def get_nowait(self):
+        try:
+            return self.items.popleft()
+        except IndexError:
+            raise queue.Empty
+
+    def get(self, block=True, timeout=None):
+        if not block:
+            return self.get_nowait()
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        remaining_timeout = timeout
+        while True:
+            try:
+                return self.items.popleft()
+            except IndexError:
+                pass
+            if timeout is not None:
+                remaining_timeout = deadline - time.monotonic()
+                if remaining_timeout <= 0:
+                    raise queue.Empty
+            self.ready.clear()
+            if not self.items: # recheck after clear() to not miss put() in between
+                self.ready.wait(remaining_timeout)
+
+    def qsize(self):
+        return len(self.items)
 
 class OpenthermInterface(ABC):
 
@@ -734,7 +876,7 @@ class OpenthermInterface(ABC):
             resp = " with resp %u/0x%04x and resp data %u/0x%04x" % (r[2], r[2] & 0xffff, r[3], r[3] & 0xffff)
         else:
             resp = ""
-        logging.debug("send_cmd() returning %d results: %d, \'%s\'%s" % (len(r), r[0], r[1], resp));
+        logging.debug("send_cmd() returning %d results: %d, \'%s\'%s", len(r), r[0], r[1], resp);
         return r
 
     @abstractmethod
@@ -742,6 +884,14 @@ class OpenthermInterface(ABC):
     # Disconnect to the nevoton's opentherm interface device
         pass
 
+    # interfaces are context managers, leaving the 'with' block disconnects
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+        return False
+
 
 
 ##############
@@ -756,21 +906,22 @@ class OTMQTTInterfaсe(OpenthermInterface):
         try:
             mqtt = importlib.import_module('paho.mqtt.client')
         except Exception as e:
-            logging.error("Got paho.mqtt.client import_module exception: %s" % e)
+            logging.error("Got paho.mqtt.client import_module exception: %s", e)
             print("Unable to load MQTT client connection module 'paho.mqtt.client'. Try to install it with 'apt-get install python3-paho-mqtt'")
             raise e
 
-        client_id = str(time.time()) + str(random.randint(0, 100000))
+        client_id = str(time.time()) + str(os.getpid())
 
         self.client = mqtt.Client(client_id)
         self.client.on_log = self.process_log
         self.client.enable_logger(logging.getLogger(__name__))
 
-        self.replyQ = queue.Queue()
+        self.replyQ = ReplyQueue()
         self.otdevice = dev_id
         self.verbose = verbose
         self.ot_decoder = ot_decoder
         self.client.on_message = self.process_mqtt_message
+        self.client.on_socket_open = self.process_socket_open
         self.dev_path = DEV_PREF + '/' + self.otdevice
 
         if username:
@@ -781,78 +932,101 @@ class OTMQTTInterfaсe(OpenthermInterface):
 
         self.mqtt_connected = False
         self.connected = False
-        self.nctl_command = ""
-        self.nctl_id = ""
-        self.nctl_data = ""
+        self.topic_command = ""
+        self.topic_id = ""
+        self.topic_data = ""
+        self.topic_command_on = ""
+        self.topic_id_on = ""
+        self.topic_data_on = ""
+        self.topic_kinds = {}
         self.tr_cmd_reply = ""
         self.tr_id_reply = ""
+        self.tr_id_reply_n = None
         self.tr_data_reply = ""
+        self.tr_data_reply_n = None
         logging.debug("OTMQTTInterfaсe initialized")
 
     def get_device_id(self):
     	return self.otdevice
 
+    # build full device topic names once, they are used for every subscribe/publish and reply match
+    def set_topics(self, nctl_command, nctl_id, nctl_data):
+        self.topic_command = sys.intern(self.dev_path + nctl_command)
+        self.topic_id = sys.intern(self.dev_path + nctl_id)
+        self.topic_data = sys.intern(self.dev_path + nctl_data)
+        self.topic_command_on = sys.intern(self.topic_command + NCTL_SUFFIX)
+        self.topic_id_on = sys.intern(self.topic_id + NCTL_SUFFIX)
+        self.topic_data_on = sys.intern(self.topic_data + NCTL_SUFFIX)
+        # replies are classified by topic once on arrival (see process_mqtt_message)
+        self.topic_kinds = { self.topic_command: NCTL_KIND_COMMAND, self.topic_id: NCTL_KIND_ID, self.topic_data: NCTL_KIND_DATA }
+
     def save_msgdata(self, r):
-        replyStr = str(r.replyData.decode("utf-8"))
-        if self.nctl_command in r.replyTopic:
+        replyStr = r.replyStr
+        if r.kind == NCTL_KIND_COMMAND:
             self.tr_cmd_reply = replyStr
-            logging.debug("Saving Transparent Command \'%s\'" % replyStr)
-        elif self.nctl_id in r.replyTopic:
-            self.tr_id_reply = replyStr
-            logging.debug("Saving Transparent ID \'%s\'" % replyStr)
-        elif self.nctl_data in r.replyTopic:
-            self.tr_data_reply = replyStr
-            logging.debug("Saving Transparent Data \'%s\'" % replyStr)
+            logging.debug("Saving Transparent Command \'%s\'", replyStr)
+        elif r.kind == NCTL_KIND_ID:
+            self.tr_id_reply, self.tr_id_reply_n = replyStr, r.replyNum
+            logging.debug("Saving Transparent ID \'%s\'", replyStr)
+        elif r.kind == NCTL_KIND_DATA:
+            self.tr_data_reply, self.tr_data_reply_n = replyStr, r.replyNum
+            logging.debug("Saving Transparent Data \'%s\'", replyStr)
         else:
-            logging.warning("Got msg for unknown topic \'%s\' (%s)" % (r.replyTopic, replyStr))
+            logging.warning("Got msg for unknown topic \'%s\' (%s)", r.replyTopic, replyStr)
 
 
-    def clear_input(self, timeout, report_warnings):
+    # drop (but save data of) queued replies arrived within timeout; stop early as soon as expected_items are dropped (if given)
+    def clear_input(self, timeout, report_warnings, expected_items=0):
         logging.info("clearing async mqtt data queue")
         dropped_items = 0
         qs = self.replyQ.qsize()
-        logging.debug("queue size %d on clear_input(%d,%d)" % (qs, timeout, report_warnings))
+        logging.debug("queue size %d on clear_input(%d,%d)", qs, timeout, report_warnings)
         if report_warnings and (qs != 0):
-            logging.warning("reply queue is not empty (%d)" % qs);
+            logging.warning("reply queue is not empty (%d)", qs);
         if timeout == 0:
+            if qs == 0: # nothing to drop (the usual case on every send_cmd)
+                return 0
             try:
                 while (True):
                     r = self.replyQ.get_nowait()
                     self.save_msgdata(r)
                     dropped_items += 1
                     if report_warnings:
-                        logging.warning("unexpected queued item %d: t=%s, topic=%s, d=%s" % (dropped_items, time.strftime("%H:%M:%S", time.localtime(r.arrivalTime)), r.replyTopic, r.replyData ))
+                        logging.warning("unexpected queued item %d: t=%s, topic=%s, d=%s", dropped_items, time.strftime("%H:%M:%S", time.localtime(r.arrivalTime)), r.replyTopic, r.replyData)
             except queue.Empty as err:
                 pass
-            logging.debug("clear_input/0 finished (%d items dropped)" % dropped_items)
+            logging.debug("clear_input/0 finished (%d items dropped)", dropped_items)
             return dropped_items
-        ts = time.perf_counter()
+        deadline = time.monotonic() + timeout
         remaining_timeout = timeout
         while (True):
             try:
-                logging.debug("starting get(%f)" % remaining_timeout)
+                logging.debug("starting get(%f)", remaining_timeout)
                 r = self.replyQ.get(True, remaining_timeout)
                 self.save_msgdata(r)
                 dropped_items += 1
-                logging.debug("dropping queued item %d: t=%s, topic=%s, d=%s" % (dropped_items, time.strftime("%H:%M:%S", time.localtime(r.arrivalTime)), r.replyTopic, r.replyData ))
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("dropping queued item %d: t=%s, topic=%s, d=%s", dropped_items, time.strftime("%H:%M:%S", time.localtime(r.arrivalTime)), r.replyTopic, r.replyData)
+                if dropped_items == expected_items:
+                    break
             except queue.Empty as err:
                 logging.debug("empty exception");
                 pass
-            remaining_timeout = timeout - (time.perf_counter() - ts)
-            logging.debug("new remaining timeout %f" % remaining_timeout)
+            remaining_timeout = deadline - time.monotonic()
+            logging.debug("new remaining timeout %f", remaining_timeout)
             if remaining_timeout <= 0:
                 break
-        logging.debug("clear_input finished (%d items dropped)" % dropped_items)
+        logging.debug("clear_input finished (%d items dropped)", dropped_items)
         return dropped_items
 
 
     def connect(self):
-        logging.debug("connecting mqtt at %s:%d..." % (self.host, self.port))
+        logging.debug("connecting mqtt at %s:%d...", self.host, self.port)
         self.client.loop_start()
         self.client.on_connect = self.process_connect
         self.client.on_disconnect = self.process_disconnect
 
-        ts = time.perf_counter()
+        deadline = time.monotonic() + MQTT_CONN_TIMEOUT
         remaining_timeout = MQTT_CONN_TIMEOUT
         try:
             r = self.client.connect(self.host, self.port, MQTT_CONN_TIMEOUT, bind_address="")
@@ -865,46 +1039,37 @@ class OTMQTTInterfaсe(OpenthermInterface):
         while (True):
             try:
                 r = self.connQ.get(True, remaining_timeout)
-                logging.debug("got connect() notification (connected=%d)" % self.connected)
+                logging.debug("got connect() notification (connected=%d)", self.connected)
                 if self.mqtt_connected:
                     break;
             except queue.Empty as err:
                 pass
-            remaining_timeout = MQTT_CONN_TIMEOUT - (time.perf_counter() - ts)
+            remaining_timeout = deadline - time.monotonic()
             if remaining_timeout <= 0:
                 break;
-        logging.debug("connectivity attempt finished %s" % "successfully" if self.mqtt_connected else "with error")
+        logging.debug("connectivity attempt finished %s", "successfully" if self.mqtt_connected else "with error")
 
         if self.mqtt_connected:
             logging.debug("mqtt connect notification received")
-            logging.debug("subscribing to new " + self.dev_path + " transparent control topics")
-            self.client.subscribe(self.dev_path + NCTL_COMMAND_NEW)
-            self.client.subscribe(self.dev_path + NCTL_ID_NEW)
-            self.client.subscribe(self.dev_path + NCTL_DATA_NEW)
-            if self.clear_input(1, False) == 0:
+            logging.debug("subscribing to new %s transparent control topics", self.dev_path)
+            self.set_topics(NCTL_COMMAND_NEW, NCTL_ID_NEW, NCTL_DATA_NEW)
+            self.client.subscribe([(self.topic_command, 0), (self.topic_id, 0), (self.topic_data, 0)])
+            # retained values of all three topics arrive right after subscription if the topics exist
+            if self.clear_input(1, False, 3) == 0:
                 logging.debug("no new NCTL topics exist");
-                self.client.unsubscribe(self.dev_path + NCTL_COMMAND_NEW)
-                self.client.unsubscribe(self.dev_path + NCTL_ID_NEW)
-                self.client.unsubscribe(self.dev_path + NCTL_DATA_NEW)
+                self.client.unsubscribe([self.topic_command, self.topic_id, self.topic_data])
 
-                logging.debug("subscribing to old " + self.dev_path + " transparent control topics")
-                self.client.subscribe(self.dev_path + NCTL_COMMAND_OLD)
-                self.client.subscribe(self.dev_path + NCTL_ID_OLD)
-                self.client.subscribe(self.dev_path + NCTL_DATA_OLD)
+                logging.debug("subscribing to old %s transparent control topics", self.dev_path)
+                self.set_topics(NCTL_COMMAND_OLD, NCTL_ID_OLD, NCTL_DATA_OLD)
+                self.client.subscribe([(self.topic_command, 0), (self.topic_id, 0), (self.topic_data, 0)])
 
-                if self.clear_input(1, False) == 0:
-                    logging.error("it seems that " + self.otdevice + " could not be controlled over mqtt, no respective transparent control topics exist")
+                if self.clear_input(1, False, 3) == 0:
+                    logging.error("it seems that %s could not be controlled over mqtt, no respective transparent control topics exist", self.otdevice)
                     return -7, "No MQTT controls for device \'%s\' found" % self.otdevice
                 else:
-                    logging.info("mqtt opentherm device \'%s\' found, transparent control topics (old) subscribed" % self.otdevice)
-                    self.nctl_command = NCTL_COMMAND_OLD
-                    self.nctl_id = NCTL_ID_OLD
-                    self.nctl_data = NCTL_DATA_OLD
+                    logging.info("mqtt opentherm device \'%s\' found, transparent control topics (old) subscribed", self.otdevice)
             else:
-                logging.info("mqtt opentherm device \'%s\' found, transparent control topics (new) subscribed" % self.otdevice)
-                self.nctl_command = NCTL_COMMAND_NEW
-                self.nctl_id = NCTL_ID_NEW
-                self.nctl_data = NCTL_DATA_NEW
+                logging.info("mqtt opentherm device \'%s\' found, transparent control topics (new) subscribed", self.otdevice)
 
             if self.verbose:
                 print("Opentherm device \'%s\' found in MQTT" % self.otdevice)
@@ -934,156 +1099,147 @@ class OTMQTTInterfaсe(OpenthermInterface):
             logging.error("calling of send_cmd on non-connected interface")
             return -100, "Not connected"
         self.clear_input(0, True)
-        logging.info("sending cmd %d with dataid %d and param %d" % (cmd, cmdid, prm))
-        self.client.publish(self.dev_path + self.nctl_command + NCTL_SUFFIX, str(cmd))
-        self.client.publish(self.dev_path + self.nctl_id + NCTL_SUFFIX, str(cmdid))
-        self.client.publish(self.dev_path + self.nctl_data + NCTL_SUFFIX, str(prm))
-        ts = time.perf_counter()
+        logging.info("sending cmd %d with dataid %d and param %d", cmd, cmdid, prm)
+        self.client.publish(self.topic_command_on, str(cmd), qos=0, retain=False)
+        self.client.publish(self.topic_id_on, str(cmdid), qos=0, retain=False)
+        self.client.publish(self.topic_data_on, str(prm), qos=0, retain=False)
+        ts = time.monotonic()
+        part_deadline = ts + MQTT_PartResponseTimeout
+        deadline = ts + MQTT_ResponseTimeout
         got_cmd_replies = 0
         got_data_replies = 0
-        cmd_response = ""
+        cmd_response = None     # numeric opentherm response (message type)
         cmd_response_data = ""
+        cmd_response_data_n = None
         remaining_timeout = MQTT_PartResponseTimeout
-        logging.debug("starting wait loop with timeout of %d secs" % remaining_timeout)
+        logging.debug("starting wait loop with timeout of %d secs", remaining_timeout)
         while (True):
             try:
                 r = self.replyQ.get(True, remaining_timeout)
-                logging.debug("got queued item (replies %d/%d): t=%s (%d secs passed), topic=%s, d=%s" % (got_cmd_replies, got_data_replies, time.strftime("%H:%M:%S", time.localtime(r.arrivalTime)), int(time.perf_counter() - ts), r.replyTopic, r.replyData ))
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("got queued item (replies %d/%d): t=%s (%d secs passed), topic=%s, d=%s", got_cmd_replies, got_data_replies, time.strftime("%H:%M:%S", time.localtime(r.arrivalTime)), int(time.monotonic() - ts), r.replyTopic, r.replyData)
                 self.save_msgdata(r)
-                replyStr = str(r.replyData.decode("utf-8"))
-                if self.nctl_command in r.replyTopic:
+                replyStr = r.replyStr
+                replyNum = r.replyNum
+                if r.kind == NCTL_KIND_COMMAND:
                     got_cmd_replies += 1
                     if got_cmd_replies == 1:
-                        if replyStr == str(cmd):
+                        if replyNum == cmd:
                             logging.debug("got command processing reply")
                         else:
-                            logging.warning("got invalid command %d(%d,%d) processing reply %s (expected %s)" % (cmd, cmdid, prm, replyStr, str(cmd)))
-                            logging.debug("response received in %d seconds after command" % int(time.perf_counter() - ts))
+                            logging.warning("got invalid command %d(%d,%d) processing reply %s (expected %s)", cmd, cmdid, prm, replyStr, str(cmd))
+                            logging.debug("response received in %d seconds after command", int(time.monotonic() - ts))
                             return -2, "command validation error"
                     elif got_cmd_replies == 2:
-                        if replyStr == "0":
+                        if replyNum == 0:
                             logging.debug("got command confirmation reply")
-                        elif replyStr == "1":
-                            logging.error("got nevoton command %d(%d,%d) validation error %s" % (cmd, cmdid, prm, replyStr))
-                            logging.debug("response received in %d seconds after command" % int(time.perf_counter() - ts))
+                        elif replyNum == 1:
+                            logging.error("got nevoton command %d(%d,%d) validation error %s", cmd, cmdid, prm, replyStr)
+                            logging.debug("response received in %d seconds after command", int(time.monotonic() - ts))
                             return -2, "invalid nevoton command"
-                        elif (cmd == NCMD_READ and replyStr == str(OT_READ_ACK)) or (cmd == NCMD_WRITE and replyStr == str(OT_WRITE_ACK)):
+                        elif (cmd == NCMD_READ and replyNum == OT_READ_ACK) or (cmd == NCMD_WRITE and replyNum == OT_WRITE_ACK):
                             # it happens time to time...
-                            logging.warning("got unsolicited command %d(%d,%d) response %s (assume valid confirmation)" % (cmd, cmdid, prm, replyStr))
-                            cmd_response = replyStr
-                        elif (replyStr == str(OT_DATA_INVALID)) or (replyStr == str(OT_UNKNOWN_DATA_ID)):
-                            logging.error("got unsolicited opentherm response %s/%s" % (self.ot_decoder.msg_descr(int(replyStr)), replyStr))
-                            logging.debug("response received in %d seconds after command" % int(time.perf_counter() - ts))
-                            return -1, "got %s/%s response" % (self.ot_decoder.msg_descr(int(replyStr)), replyStr), int(replyStr), -1
+                            logging.warning("got unsolicited command %d(%d,%d) response %s (assume valid confirmation)", cmd, cmdid, prm, replyStr)
+                            cmd_response = replyNum
+                        elif (replyNum == OT_DATA_INVALID) or (replyNum == OT_UNKNOWN_DATA_ID):
+                            logging.error("got unsolicited opentherm response %s/%d", self.ot_decoder.msg_descr(replyNum), replyNum)
+                            logging.debug("response received in %d seconds after command", int(time.monotonic() - ts))
+                            return -1, "got %s/%d response" % (self.ot_decoder.msg_descr(replyNum), replyNum), replyNum, -1
                         else:
-                            logging.error("got unexpected command %d(%d,%d) response %s" % (cmd, cmdid, prm, replyStr))
-                            logging.debug("response received in %d seconds after command" % int(time.perf_counter() - ts))
+                            logging.error("got unexpected command %d(%d,%d) response %s", cmd, cmdid, prm, replyStr)
+                            logging.debug("response received in %d seconds after command", int(time.monotonic() - ts))
                             return -2, "invalid response"
                     else:
-                        if cmd_response != "":
-                            logging.error("got unexpected second cmd %d(%d,%d) response %s (first was %s)" % (cmd, cmdid, prm, replyStr, cmd_response))
+                        if cmd_response is not None:
+                            logging.error("got unexpected second cmd %d(%d,%d) response %s (first was %d)", cmd, cmdid, prm, replyStr, cmd_response)
                         else:
-                            cmd_response = replyStr
-                            if (cmd == NCMD_READ and cmd_response == str(OT_READ_ACK)) or (cmd == NCMD_WRITE and cmd_response == str(OT_WRITE_ACK)):
-                                logging.info("got opentherm response %s/%s" % (self.ot_decoder.msg_descr(int(cmd_response)), cmd_response))
-                                pass
-                            elif (replyStr == str(OT_DATA_INVALID)) or (replyStr == str(OT_UNKNOWN_DATA_ID)):
-                                logging.error("got error opentherm response %s/%s" % (self.ot_decoder.msg_descr(int(replyStr)), replyStr))
-                                logging.debug("response received in %d seconds after command" % int(time.perf_counter() - ts))
-                                return -1, "got %s/%s response" % (self.ot_decoder.msg_descr(int(replyStr)), replyStr), int(replyStr), -1
+                            if (cmd == NCMD_READ and replyNum == OT_READ_ACK) or (cmd == NCMD_WRITE and replyNum == OT_WRITE_ACK):
+                                cmd_response = replyNum
+                                logging.info("got opentherm response %s/%d", self.ot_decoder.msg_descr(cmd_response), cmd_response)
+                            elif (replyNum == OT_DATA_INVALID) or (replyNum == OT_UNKNOWN_DATA_ID):
+                                logging.error("got error opentherm response %s/%d", self.ot_decoder.msg_descr(replyNum), replyNum)
+                                logging.debug("response received in %d seconds after command", int(time.monotonic() - ts))
+                                return -1, "got %s/%d response" % (self.ot_decoder.msg_descr(replyNum), replyNum), replyNum, -1
                             else:
-                                logging.error("got invalid opentherm response \'%s\' on cmd %d with dataid %d and prm %d" % (replyStr, cmd, cmdid, prm))
-                                logging.debug("response received in %d seconds after command" % int(time.perf_counter() - ts))
-                                return -2, "invalid opentherm response (%s)" % cmd_response
-                elif self.nctl_id in r.replyTopic:
+                                logging.error("got invalid opentherm response \'%s\' on cmd %d with dataid %d and prm %d", replyStr, cmd, cmdid, prm)
+                                logging.debug("response received in %d seconds after command", int(time.monotonic() - ts))
+                                return -2, "invalid opentherm response (%s)" % replyStr
+                elif r.kind == NCTL_KIND_ID:
                     # actually does not arrive at all if "0" was sent to "TR ID/on"
-                    if replyStr == str(cmdid):
+                    if replyNum == cmdid:
                         logging.debug("got command id processing reply")
-                    if replyStr == "0":
+                    if replyNum == 0:
                         logging.debug("got command id confirmation reply")
-                elif self.nctl_data in r.replyTopic:
+                elif r.kind == NCTL_KIND_DATA:
                     got_data_replies += 1
                     if got_data_replies == 1:
-                        if replyStr == str(prm):
+                        if replyNum == prm:
                             logging.debug("got command data processing reply")
                         else:
-                            if (cmd == NCMD_READ and cmd_response == str(OT_READ_ACK)) or (cmd == NCMD_WRITE and cmd_response == str(OT_WRITE_ACK)):
+                            if (cmd == NCMD_READ and cmd_response == OT_READ_ACK) or (cmd == NCMD_WRITE and cmd_response == OT_WRITE_ACK):
                                 # workaround: if there were neither command data processing reply nor got command data confirmation reply but command ACK is already here
-                                cmd_response_data = replyStr
-                                logging.info("got (unlikely) supposed opentherm response data \'%s\'" % cmd_response_data)
+                                cmd_response_data, cmd_response_data_n = replyStr, replyNum
+                                logging.info("got (unlikely) supposed opentherm response data \'%s\'", cmd_response_data)
                             elif got_cmd_replies >= 2:
                                 # workaround: if there were neither command data processing reply nor got command data confirmation reply but there were several command confirmations
-                                cmd_response_data = replyStr
-                                logging.info("got (highly unlikely) supposed opentherm response data \'%s\'" % cmd_response_data)
+                                cmd_response_data, cmd_response_data_n = replyStr, replyNum
+                                logging.info("got (highly unlikely) supposed opentherm response data \'%s\'", cmd_response_data)
                             else:
-                                logging.error("got cmd %d(%d,%d) invalid data processing reply \'%s\'" % (cmd, cmdid, prm, replyStr))
-                                logging.debug("response received in %d seconds after command" % int(time.perf_counter() - ts))
+                                logging.error("got cmd %d(%d,%d) invalid data processing reply \'%s\'", cmd, cmdid, prm, replyStr)
+                                logging.debug("response received in %d seconds after command", int(time.monotonic() - ts))
                                 return -2, "command validation error"
                     elif got_data_replies ==2:
-                        if replyStr == "0":
+                        if replyNum == 0:
                             logging.debug("got command data confirmation reply")
                         else:
                             # workaround: if TR Data confirmation "0" does not arrive at all
-                            cmd_response_data = replyStr
-                            logging.warning("got supposed opentherm response data \'%s\'" % cmd_response_data)
+                            cmd_response_data, cmd_response_data_n = replyStr, replyNum
+                            logging.warning("got supposed opentherm response data \'%s\'", cmd_response_data)
                     else:
                         if cmd_response_data != "":
-                            logging.error("got second cmd %d(%d,%d) response data \'%s\' (first was \'%s\')" % (cmd, cmdid, prm, replyStr, cmd_response_data))
+                            logging.error("got second cmd %d(%d,%d) response data \'%s\' (first was \'%s\')", cmd, cmdid, prm, replyStr, cmd_response_data)
                         else:
-                            cmd_response_data = replyStr
-                            logging.debug("got opentherm response data \'%s\'" % cmd_response_data)
+                            cmd_response_data, cmd_response_data_n = replyStr, replyNum
+                            logging.debug("got opentherm response data \'%s\'", cmd_response_data)
                 else:
-                    logging.warning("got unexpected mqtt msg on %s with %s in reply to cmd %d(%d,%d)" % (r.replyTopic, replyStr, cmd, cmdid, prm))
-                if (cmd_response != "") and (cmd_response_data != ""):
-                    logging.info("got full opentherm response in %d seconds after command" % int(time.perf_counter() - ts))
-                    try:
-                        cmd_response_n = int(cmd_response)
-                    except:
-                        logging.error("exception on conversion of cmd response \'%s\' to number" % cmd_response)
-                        return -2, "non-numeric response cmd (%s)" % cmd_response
-                    try:
-                        cmd_response_data_n = int(cmd_response_data)
-                    except:
-                        logging.error("exception on conversion of cmd response data \'%s\' to number" % cmd_response_data)
+                    logging.warning("got unexpected mqtt msg on %s with %s in reply to cmd %d(%d,%d)", r.replyTopic, replyStr, cmd, cmdid, prm)
+                if (cmd_response is not None) and (cmd_response_data != ""):
+                    logging.info("got full opentherm response in %d seconds after command", int(time.monotonic() - ts))
+                    if cmd_response_data_n is None:
+                        logging.error("cmd response data \'%s\' is not a number", cmd_response_data)
                         return -2, "non-numeric response data (%s)" % cmd_response_data
-                    if (cmd == NCMD_READ and cmd_response == str(OT_READ_ACK)) or (cmd == NCMD_WRITE and cmd_response == str(OT_WRITE_ACK)):
-                        logging.info("Returning successful response %d and data %d" % (cmd_response_n, cmd_response_data_n))
-                        return 1, "ok", cmd_response_n, cmd_response_data_n
-                    elif (cmd_response == str(OT_DATA_INVALID)) or (cmd_response == str(OT_UNKNOWN_DATA_ID)):
-                        logging.info("got opentherm response %s/%d" % (self.ot_decoder.msg_descr(cmd_response_n), cmd_response_n))
-                        return -1, "got %s/%d response" % (self.ot_decoder.msg_descr(cmd_response_n), cmd_response_n), cmd_response_n, cmd_response_data_n
+                    if (cmd == NCMD_READ and cmd_response == OT_READ_ACK) or (cmd == NCMD_WRITE and cmd_response == OT_WRITE_ACK):
+                        logging.info("Returning successful response %d and data %d", cmd_response, cmd_response_data_n)
+                        return 1, "ok", cmd_response, cmd_response_data_n
+                    elif (cmd_response == OT_DATA_INVALID) or (cmd_response == OT_UNKNOWN_DATA_ID):
+                        logging.info("got opentherm response %s/%d", self.ot_decoder.msg_descr(cmd_response), cmd_response)
+                        return -1, "got %s/%d response" % (self.ot_decoder.msg_descr(cmd_response), cmd_response), cmd_response, cmd_response_data_n
                     else:
-                        logging.info("got erroneous opentherm response %s/%d with data %d" % (self.ot_decoder.msg_descr(cmd_response_n), cmd_response_n, cmd_response_data_n))
-                        return -3, "got %s/%d erroneous response" % (self.ot_decoder.msg_descr(cmd_response_n), cmd_response_n), cmd_response_n, cmd_response_data_n
+                        logging.info("got erroneous opentherm response %s/%d with data %d", self.ot_decoder.msg_descr(cmd_response), cmd_response, cmd_response_data_n)
+                        return -3, "got %s/%d erroneous response" % (self.ot_decoder.msg_descr(cmd_response), cmd_response), cmd_response, cmd_response_data_n
 
             except queue.Empty as err:
-                if time.perf_counter() - ts >= MQTT_PartResponseTimeout:
-                    if ((cmd == NCMD_READ and cmd_response == str(OT_READ_ACK)) or (cmd == NCMD_WRITE and cmd_response == str(OT_WRITE_ACK))) and (self.tr_id_reply == str(cmdid)):
-                        logging.info("Treat saved data \'%s\' as received from opentherm slave" % self.tr_data_reply)
-                        try:
-                            cmd_response_n = int(cmd_response)
-                        except:
-                            logging.error("exception on conversion2 of cmd response \'%s\' to number" % cmd_response)
-                            return -2, "non-numeric response cmd (%s)" % cmd_response
-                        try:
-                            cmd_response_data_n = int(self.tr_data_reply)
-                        except:
-                            logging.error("exception on conversion2 of saved cmd response data \'%s\' to number" % self.tr_data_reply)
+                if time.monotonic() >= part_deadline:
+                    if ((cmd == NCMD_READ and cmd_response == OT_READ_ACK) or (cmd == NCMD_WRITE and cmd_response == OT_WRITE_ACK)) and (self.tr_id_reply_n == cmdid):
+                        logging.info("Treat saved data \'%s\' as received from opentherm slave", self.tr_data_reply)
+                        if self.tr_data_reply_n is None:
+                            logging.error("saved cmd response data \'%s\' is not a number", self.tr_data_reply)
                             return -2, "non-numeric response data (%s)" % self.tr_data_reply
-                        logging.info("Returning successful response %d and data %d" % (cmd_response_n, cmd_response_data_n))
-                        return 1, "ok", cmd_response_n, cmd_response_data_n
+                        logging.info("Returning successful response %d and data %d", cmd_response, self.tr_data_reply_n)
+                        return 1, "ok", cmd_response, self.tr_data_reply_n
                         
-                if ((got_cmd_replies + got_data_replies == 0) & (time.perf_counter() - ts >= MQTT_ReplyTimeout)):
-                    logging.error("absolutely no response from opentherm driver on cmd %d" % cmd);
+                if ((got_cmd_replies + got_data_replies == 0) & (time.monotonic() - ts >= MQTT_ReplyTimeout)):
+                    logging.error("absolutely no response from opentherm driver on cmd %d", cmd);
                     return -7, "No response from Nevoton driver"
 
-            remaining_timeout = MQTT_PartResponseTimeout - (time.perf_counter() - ts)
+            now = time.monotonic()
+            remaining_timeout = part_deadline - now
             if remaining_timeout < 0:
-                remaining_timeout = MQTT_ResponseTimeout - (time.perf_counter() - ts)
+                remaining_timeout = deadline - now
             if remaining_timeout <= 0:
-                logging.error("no response from opentherm device to cmd %d(%d,%d) within %d seconds" % (cmd, cmdid, prm, MQTT_ResponseTimeout))
+                logging.error("no response from opentherm device to cmd %d(%d,%d) within %d seconds", cmd, cmdid, prm, MQTT_ResponseTimeout)
                 return -5, "Nevoton driver response timeout"
-            logging.debug("restarting wait loop with timeout of %d secs" % remaining_timeout)
+            logging.debug("restarting wait loop with timeout of %d secs", remaining_timeout)
 
 
     def process_connect(self, _, userdata, flags, rc):
@@ -1091,7 +1247,7 @@ class OTMQTTInterfaсe(OpenthermInterface):
             logging.info("async mqtt connected ok")
             self.mqtt_connected = True
         else:
-            logging.error("async mqtt connect error %s(%d) [%s]" % (connack_string(rc), rc, str(flags)))
+            logging.error("async mqtt connect error %s(%d) [%s]", connack_string(rc), rc, str(flags))
             self.mqtt_connected = False
         self.connQ.put(self.mqtt_connected)
         
@@ -1100,20 +1256,27 @@ class OTMQTTInterfaсe(OpenthermInterface):
         if rc == 0:
             logging.info("async mqtt disconnected ok")
         else:
-            logging.error("async mqtt unexpectedly disconnected (%d)" % rc)
+            logging.error("async mqtt unexpectedly disconnected (%d)", rc)
         self.connQ.put(self.mqtt_connected)
 
+    # commands and replies are tiny packets, do not let Nagle hold them back
+    def process_socket_open(self, _, userdata, sock):
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (OSError, AttributeError) as e: # e.g. websocket transport
+            logging.debug("unable to set TCP_NODELAY on mqtt socket: %s", e)
+
     # does not actually work at all...
     def process_log(self, _, level, buf):
-        logging.debug('async mqtt log: ' + buf)
+        logging.debug("async mqtt log: %s", buf)
 
     def process_mqtt_message(self, _, arg1, arg2=None):
         if arg2 is None:
             msg = arg1
         else:
             msg = arg2
-        logging.debug("got mqtt msg on [%s] with [%s]" % (msg.topic, msg.payload))
-        self.replyQ.put(Reply(time.time(), msg.topic, msg.payload))
+        logging.debug("got mqtt msg on [%s] with [%s]", msg.topic, msg.payload)
+        self.replyQ.put(Reply(time.time(), msg.topic, msg.payload, self.topic_kinds.get(msg.topic, NCTL_KIND_UNKNOWN)))
 
     def __del__(self):
         if self.client:
@@ -1131,12 +1294,13 @@ class OTSerialInterfaсe(OpenthermInterface):
         try:
             self.modbus = importlib.import_module('pymodbus.client.sync')
         except Exception as e:
-            logging.error("Got pymodbus.client.sync import_module exception: %s" % e)
+            logging.error("Got pymodbus.client.sync import_module exception: %s", e)
             print("Unable to load Modbus client connection module 'pymodbus.client.sync'. Try to install it with 'apt-get install python3-pymodbus'")
             raise e
         self.connected = False
         self.device = serial_device
         self.modbus_id = modbus_id
+        self.write_multiple = True # command regs 209-211 are written with one request until the module rejects it
         self.verbose = verbose
         self.ot_decoder = ot_decoder
         pass
@@ -1148,59 +1312,61 @@ class OTSerialInterfaсe(OpenthermInterface):
         return self.device
 
     def connect(self):
-        logging.debug("connecting serial device %s..." % (self.device))
+        logging.debug("connecting serial device %s...", self.device)
         try:
-            self.client = self.modbus.ModbusSerialClient(
-                        method='rtu',
-                        port=self.device,  # serial port device like "/dev/ttyMOD1"
-                        # It is believed that the following params could be nailed down due to the nature of Nevoton's device
-                        #    framer=ModbusRtuFramer,
-                            timeout=10,
-                            retries=3,
-                        #    retry_on_empty=False,
-                            close_comm_on_error=False,
-                        #    strict=True,
-                        # Serial setup parameters
-                            baudrate=19200,
-                            bytesize=8,
-                            parity="N",
-                            stopbits=1,
-                        #    handle_local_echo=False,
-                    )
+            if self.client is None: # serial client (and its framer) is set up once and reused on reconnects
+                self.client = self.modbus.ModbusSerialClient(
+                            method='rtu',
+                            port=self.device,  # serial port device like "/dev/ttyMOD1"
+                            # It is believed that the following params could be nailed down due to the nature of Nevoton's device
+                            #    framer=ModbusRtuFramer,
+                                timeout=Modbus_FrameTimeout,
+                                retries=3,
+                            #    retry_on_empty=False,
+                                close_comm_on_error=False,
+                            #    strict=True,
+                            # Serial setup parameters
+                                baudrate=19200,
+                                bytesize=8,
+                                parity="N",
+                                stopbits=1,
+                            #    handle_local_echo=False,
+                        )
             result = self.client.connect()
         except Exception as e:
-            logging.error("Got ModbusSerialClient exception: %s" % e)
+            logging.error("Got ModbusSerialClient exception: %s", e)
             return -7, "Got exception connecting serial device \'%s\': %s" % (self.device, e)
 
-        logging.debug("connect returned %s with %s" % (type(result).__name__, str(result)))
+        logging.debug("connect returned %s with %s", type(result).__name__, str(result))
         if result != True:
             return -7, "Could not connect serial device \'%s\'" % (self.device)
 
         logging.debug("Reading module info regs...")
         result = self.client.read_input_registers(200, 5, unit=self.modbus_id)
-        logging.debug("read_input_registers returned %s with %s / %s" % (type(result).__name__, str(result.__dict__), str(result)))
+        logging.debug("read_input_registers returned %s with %s / %s", type(result).__name__, result.__dict__, result)
         if result.isError():
             return -7, "Unable to read Nevoton's module info registers through \'%s\', modbusId %d: %s, %s" % (self.device, self.modbus_id, type(result).__name__, str(result))
 
         r = result.registers
-        modulename = "".join((chr(r[n]>>8) if chr(r[n]>>8).isalnum() else "") + (chr(r[n]&255) if chr(r[n]&255).isalnum() else "") for n in range(0,4))
-        logging.debug("read modulename \'%s\', fw %d.%02d" % (modulename, r[4]/100, r[4]%100))
+        modulename = "".join(c for c in struct.pack(">4H", *r[0:4]).decode("latin1") if c.isalnum()) # 2 chars per reg, high byte first
+        fw_major, fw_minor = divmod(r[4], 100)
+        logging.debug("read modulename \'%s\', fw %d.%02d", modulename, fw_major, fw_minor)
 
         if modulename != "BCG102W":
             return -7, "Unsupported module \'%s\'" % modulename
 
         if r[4] < 130: # transparent control registers are available in fw 1.30+
-            return -7, "Unsupported module firmware version \'%d.%02d\'" % (r[4]/100, r[4]%100)
+            return -7, "Unsupported module firmware version \'%d.%02d\'" % (fw_major, fw_minor)
 
-        logging.info("Connected %s, modbus id %d, detected modulename \'%s\', fw %d.%02d" % (self.device, self.modbus_id, modulename, r[4]/100, r[4]%100))
+        logging.info("Connected %s, modbus id %d, detected modulename \'%s\', fw %d.%02d", self.device, self.modbus_id, modulename, fw_major, fw_minor)
         if self.verbose:
-           print("Opentherm device \'%s\' fw %d.%02d connected through %s (%d)" % (modulename, r[4]/100, r[4]%100, self.device, self.modbus_id))
+           print("Opentherm device \'%s\' fw %d.%02d connected through %s (%d)" % (modulename, fw_major, fw_minor, self.device, self.modbus_id))
         self.connected = True
         return 1, "Ok"
 
     def disconnect(self):
         if self.connected:
-            logging.debug("closing connection to %s..." % self.device)
+            logging.debug("closing connection to %s...", self.device)
             self.client.close()
             self.connected = False
 
@@ -1209,9 +1375,18 @@ class OTSerialInterfaсe(OpenthermInterface):
 
     def write_reg(self, reg_n, data):
         result = self.client.write_register(reg_n, data, unit=self.modbus_id)
-        logging.debug("writing reg %d returned %s with %s / %s" % (reg_n, type(result).__name__, str(result.__dict__), str(result)))
+        logging.debug("writing reg %d returned %s with %s / %s", reg_n, type(result).__name__, result.__dict__, result)
         if result.isError():
-            return -2, "Error writing reg 209: %s, %s" % (type(result).__name__, str(result))
+            return -2, "Error writing reg %d: %s, %s" % (reg_n, type(result).__name__, str(result))
+        return 1, "ok"
+
+    # write consecutive regs with a single modbus request (FC16);
+    # return -6 if the module answered with modbus exception i.e. it does not accept such request
+    def write_regs(self, reg_n, data):
+        result = self.client.write_registers(reg_n, data, unit=self.modbus_id)
+        logging.debug("writing regs %d-%d returned %s with %s / %s", reg_n, reg_n + len(data) - 1, type(result).__name__, result.__dict__, result)
+        if result.isError():
+            return -6 if hasattr(result, "exception_code") else -2, "Error writing regs %d-%d: %s, %s" % (reg_n, reg_n + len(data) - 1, type(result).__name__, str(result))
         return 1, "ok"
 
     #
@@ -1221,44 +1396,59 @@ class OTSerialInterfaсe(OpenthermInterface):
         if not self.connected:
             logging.error("calling of send_cmd on non-connected interface")
             return -100, "not connected"
-        logging.info("sending cmd %d with dataid %d and param %d" % (cmd, cmdid, prm))
-
-        r = self.write_reg(209, cmd)
-        if r[0] < 0:
-        	return r
-        r = self.write_reg(210, cmdid)
-        if r[0] < 0:
-        	return r
-        r = self.write_reg(211, prm)
-        if r[0] < 0:
-        	return r
-
-        ts = time.perf_counter()
-        while time.perf_counter() - ts < Modbus_ResponseTimeout:
+        logging.info("sending cmd %d with dataid %d and param %d", cmd, cmdid, prm)
+
+        if self.write_multiple:
+            r = self.write_regs(209, [cmd, cmdid, prm]) # one round-trip instead of three
+            if r[0] == -6:
+                logging.warning("module does not accept multiple registers write (%s), falling back to single register writes", r[1])
+                self.write_multiple = False
+            elif r[0] < 0:
+                return r
+        if not self.write_multiple:
+            r = self.write_reg(209, cmd)
+            if r[0] < 0:
+            	return r
+            r = self.write_reg(210, cmdid)
+            if r[0] < 0:
+            	return r
+            r = self.write_reg(211, prm)
+            if r[0] < 0:
+            	return r
+
+        ts = time.monotonic()
+        deadline = ts + Modbus_ResponseTimeout
+        poll_delay = 0 # first re-poll goes immediately, then back off to not flood the bus while the boiler answers
+        while time.monotonic() < deadline:
             result = self.client.read_holding_registers(209, 3, unit=self.modbus_id)
-            logging.debug("read_input_registers returned %s with %s / %s" % (type(result).__name__, str(result.__dict__), str(result)))
+            logging.debug("read_input_registers returned %s with %s / %s", type(result).__name__, result.__dict__, result)
             if result.isError():
                 return -7, "unable to read Nevoton's module registers: %s, %s" % (type(result).__name__, str(result))
             r = result.registers
             if r[0] == 0 and r[1] == 0 and r[2] == 0:
                 logging.debug("allzero response read, restart reading cycle")
+                if poll_delay:
+                    time.sleep(poll_delay)
+                    poll_delay = min(poll_delay * Modbus_PollBackoff, Modbus_PollMaxDelay)
+                else:
+                    poll_delay = Modbus_PollMinDelay
                 continue
             if r[0] == NCMD_VAL_ERROR:
-                logging.error("got nevoton command %d(%d,%d) validation error" % (cmd, cmdid, prm))
-                logging.debug("response received in %d seconds after command" % int(time.perf_counter() - ts))
+                logging.error("got nevoton command %d(%d,%d) validation error", cmd, cmdid, prm)
+                logging.debug("response received in %d seconds after command", int(time.monotonic() - ts))
                 return -2, "invalid nevoton command"
             if (r[0] == OT_DATA_INVALID or r[0] == OT_UNKNOWN_DATA_ID) and (r[1] == cmdid):
-                logging.error("got error opentherm response %s/%d" % (self.ot_decoder.msg_descr(r[0]), r[0]))
-                logging.debug("response received in %d seconds after command" % int(time.perf_counter() - ts))
+                logging.error("got error opentherm response %s/%d", self.ot_decoder.msg_descr(r[0]), r[0])
+                logging.debug("response received in %d seconds after command", int(time.monotonic() - ts))
                 return -1, "got %s/%d response" % (self.ot_decoder.msg_descr(r[0]), r[0]), r[0], r[2]
             if ((cmd == NCMD_READ and r[0] == OT_READ_ACK) or (cmd == NCMD_WRITE and r[0] == OT_WRITE_ACK)) and (r[1] == cmdid):
-                logging.info("got full opentherm response in %d seconds after command" % int(time.perf_counter() - ts))
-                logging.info("Returning successful response %d and data %d" % (r[0], r[2]))
+                logging.info("got full opentherm response in %d seconds after command", int(time.monotonic() - ts))
+                logging.info("Returning successful response %d and data %d", r[0], r[2])
                 return 1, "ok", r[0], r[2]
-            logging.error("Got inconsistent Nevoton's module response (%d,%d,%d)" % (r[0], r[1], r[2]))
+            logging.error("Got inconsistent Nevoton's module response (%d,%d,%d)", r[0], r[1], r[2])
             return -3, "inconsistent response (%d,%d,%d)" % (r[0], r[1], r[2])
 
-        logging.error("No response from opentherm device to cmd %d(%d,%d) within %d seconds" % (cmd, cmdid, prm, Modbus_ResponseTimeout))
+        logging.error("No response from opentherm device to cmd %d(%d,%d) within %d seconds", cmd, cmdid, prm, Modbus_ResponseTimeout)
         return -5, "Nevoton driver response timeout"
 
 
@@ -1271,6 +1461,18 @@ class OTSerialInterfaсe(OpenthermInterface):
 #
 # Main opentherm control logic
 #
+
+# interactive mode command list
+HELP_TEXT = ("Commands supported:\n"
+    " s[can] - scan all known readable opentherm data-id\n"
+    " f[ullscan] [<startId>[-<lastId>]] - perform unconditional read scan\n"
+    " r[ead] [<id>[/<data>]] - read data-id\n"
+    " w[rite] <id> <data> - write data-id with given data\n"
+    " readtsp/rt [<startTSP>[-<finishTSP>]] - read Transparent Slave Parameter\n"
+    " writetsp/wt <id> <data> - write Transparent Slave Parameter\n"
+    " readerr/re [<startFHB>[-<finishFHB>]] - read Fault-History-Buffer entry\n"
+    " quit\n")
+
 class OTControl:
     def __init__(self, ot_interface, ot_decoder, verbose=False, retries=1):
         self.cmd_processor = ot_interface
@@ -1280,6 +1482,12 @@ class OTControl:
 
         # specific data-values for particular data-id read operations (to be updated later)
         self.specPrm = { "000": "65280" }
+        # warm up the parse cache with the values every read/scan uses
+        for prm in ("0",) + tuple(self.specPrm.values()):
+            ot_decoder.parse_val(prm)
+
+        # known readable data-ids in table order (the decoder table is read-only)
+        self.readable_dataids = tuple(int(di) for di, d in ot_decoder.otd.items() if len(di) == 3 and "R" in d.t_dir)
 
         logging.debug("OTControl initialized")
 
@@ -1299,27 +1507,30 @@ class OTControl:
                 prm = "0"
 
         try:
-            dataid_n = int(dataid)
-        except:
-            logging.error("exception on conversion of dataid \'" + dataid + "\' to number")
+            dataid_n = int(dataid, 10)
+        except ValueError:
+            logging.error("exception on conversion of dataid \'%s\' to number", dataid)
             return -1, "Non-numeric dataid (%s)" % dataid
         try:
             prm_n = self.otdecoder.parse_val(prm)
-        except:
-            logging.error("exception on conversion of prm \'" + prm + "\' to number")
+        except ValueError:
+            logging.error("exception on conversion of prm \'%s\' to number", prm)
             return -1, "Non-numeric prm (%s)" % prm
+        return self.read_dataid(dataid_n, prm_n, ignoreAllErrors)
 
+    # read with already parsed (numeric) dataid and prm; used directly by scans
+    def read_dataid(self, dataid_n, prm_n, ignoreAllErrors = False):
         if self.verbose:
             print("Reading dataid %d%s..." % (dataid_n, ("/" + str(prm_n)) if prm_n != 0 else ""))
         retries = self.retries
         rn = 1
         while rn <= retries:
             if rn != 1:
-                eprint("Retrying...")
+                sys.stderr.write("Retrying...\n")
             rn += 1
             r = self.cmd_processor.send_cmd_verbose(NCMD_READ, dataid_n, prm_n)
             if r[0] < 0:
-                eprint("Read of dataid %d/%d failed: %s" %(dataid_n, prm_n, r[1]))
+                sys.stderr.write("Read of dataid %d/%d failed: %s\n" % (dataid_n, prm_n, r[1]))
                 if ignoreAllErrors:
                     continue;
                 if r[0] == -1 and (r[2] == OT_UNKNOWN_DATA_ID or r[2] == OT_DATA_INVALID):
@@ -1345,14 +1556,14 @@ class OTControl:
 
     def write(self, dataid, prm):
         try:
-            dataid_n = int(dataid)
-        except:
-            logging.error("exception on conversion of dataid \'" + dataid + "\' to number")
+            dataid_n = int(dataid, 10)
+        except ValueError:
+            logging.error("exception on conversion of dataid \'%s\' to number", dataid)
             return -1, "Non-numeric dataid (%s)" % dataid
         try:
             prm_n = self.otdecoder.parse_val(prm)
-        except:
-            logging.error("exception on conversion of prm \'" + prm + "\' to number")
+        except ValueError:
+            logging.error("exception on conversion of prm \'%s\' to number", prm)
             return -1, "Invalid prm value (%s)" % prm
         if self.verbose:
             print("Writing dataid %d with value %d..." % (dataid_n, prm_n))
@@ -1360,11 +1571,11 @@ class OTControl:
         rn = 1
         while rn <= retries:
             if rn != 1:
-                eprint("Retrying...")
+                sys.stderr.write("Retrying...\n")
             rn += 1
             r = self.cmd_processor.send_cmd_verbose(NCMD_WRITE, dataid_n, prm_n)
             if r[0] < 0:
-                eprint("Write of dataid %d with %d failed: %s" %(dataid_n, prm_n, r[1]))
+                sys.stderr.write("Write of dataid %d with %d failed: %s\n" % (dataid_n, prm_n, r[1]))
                 if r[0] == -1 and (r[2] == OT_UNKNOWN_DATA_ID or r[2] == OT_DATA_INVALID):
                     return -r[2], "Opentherm error " + self.otdecoder.msg_descr(r[2])
                 elif r[0] < -5:
@@ -1385,9 +1596,9 @@ class OTControl:
 
     def read_err(self, erridx):
         try:
-            erridx_n = int(erridx)
-        except:
-            logging.error("exception on conversion of erridx \'" + erridx + "\' to number")
+            erridx_n = int(erridx, 10)
+        except ValueError:
+            logging.error("exception on conversion of erridx \'%s\' to number", erridx)
             return -1, "Non-numeric erridx (%s)" % erridx
 
         if erridx_n < 0:
@@ -1405,11 +1616,12 @@ class OTControl:
                 if self.verbose:
                     print("Reading %d FHBs..." % fhbn)
                 for fi in range(0, fhbn - 1, 1):
-                    self.read_err(str(fi))
+                    self.read_erridx(fi)
                 return 1, "Ok"
-        else:
-           erridx_n = erridx_n & 0xff
+        return self.read_erridx(erridx_n & 0xff)
 
+    # read of a single FHB entry with already parsed (numeric) index
+    def read_erridx(self, erridx_n):
         if self.verbose:
             print("Reading Fault History Buffer (FHB) entry %d..." % erridx_n)
         prm = (erridx_n << 8)
@@ -1417,11 +1629,11 @@ class OTControl:
         rn = 1
         while rn <= retries:
             if rn != 1:
-                eprint("Retrying...")
+                sys.stderr.write("Retrying...\n")
             rn += 1
             r = self.cmd_processor.send_cmd_verbose(NCMD_READ, 13, prm)
             if r[0] < 0:
-                eprint("Read of TSP id %d failed: %s" %(erridx_n, r[1]))
+                sys.stderr.write("Read of TSP id %d failed: %s\n" % (erridx_n, r[1]))
                 if r[0] == -1 and (r[2] == OT_UNKNOWN_DATA_ID or r[2] == OT_DATA_INVALID):
                     return -r[2], "Opentherm error " + self.otdecoder.msg_descr(r[2])
                 elif r[0] < -5:
@@ -1451,18 +1663,18 @@ class OTControl:
             last_tspid = tspid
 
         try:
-            tspid_n = int(tspid)
-        except:
-            logging.error("exception on conversion of tspid \'" + tspid + "\' to number")
+            tspid_n = int(tspid, 10)
+        except ValueError:
+            logging.error("exception on conversion of tspid \'%s\' to number", tspid)
             return -1, "Non-numeric tspid (%s)" % tspid
 
         if len(last_tspid) == 0:
             last_tspid_n = -1
         else:
             try:
-                last_tspid_n = int(last_tspid)
-            except:
-                logging.error("exception on conversion of last_tspid \'" + last_tspid + "\' to number")
+                last_tspid_n = int(last_tspid, 10)
+            except ValueError:
+                logging.error("exception on conversion of last_tspid \'%s\' to number", last_tspid)
                 return -1, "Non-numeric last_tspid (%s)" % last_tspid
 
         if last_tspid_n < 0:
@@ -1479,7 +1691,9 @@ class OTControl:
                 tspn = ((r[3] >> 8) & 0xff)
                 if self.verbose:
                     print("There are %d TSP registers reported by boiler..." % tspn)
-                return self.read_tsp(str(tspid_n) + "-" + str(tspn - 1))
+                if tspn == 0:
+                    return 1, "Ok"
+                last_tspid_n = tspn - 1
 
         if (tspid_n >= 0) and (last_tspid_n > 0) and (tspid_n != last_tspid_n): # explicit range of TSPs
             tspid_n = tspid_n & 0xff
@@ -1487,11 +1701,14 @@ class OTControl:
             if self.verbose:
                 print("Reading TSPs from %d to %d..." % (tspid_n, last_tspid_n))
             for ti in range(tspid_n, last_tspid_n + 1, 1):
-                r = self.read_tsp(str(ti))
+                r = self.read_tspid(ti)
                 if r[0] < -5:
                     return r[0], r[1]
             return 1, "Ok"
+        return self.read_tspid(tspid_n)
 
+    # read of a single TSP with already parsed (numeric) id
+    def read_tspid(self, tspid_n):
         if self.verbose:
             print("Reading Transparent Slave Parameter (TSP) %d..." % tspid_n)
         prm = (tspid_n << 8)
@@ -1499,11 +1716,11 @@ class OTControl:
         rn = 1
         while rn <= retries:
             if rn != 1:
-                eprint("Retrying...")
+                sys.stderr.write("Retrying...\n")
             rn += 1
             r = self.cmd_processor.send_cmd_verbose(NCMD_READ, 11, prm)
             if r[0] < 0:
-                eprint("Read of TSP id %d failed: %s" %(tspid_n, r[1]))
+                sys.stderr.write("Read of TSP id %d failed: %s\n" % (tspid_n, r[1]))
                 if r[0] == -1 and (r[2] == OT_UNKNOWN_DATA_ID or r[2] == OT_DATA_INVALID):
                     return -r[2], "Opentherm error " + self.otdecoder.msg_descr(r[2])
                 elif r[0] < -5:
@@ -1524,14 +1741,14 @@ class OTControl:
 
     def write_tsp(self, tspid, tspdata):
         try:
-            tspid_n = int(tspid) & 0xff
-        except:
-            logging.error("exception on conversion of tspid \'" + tspid + "\' to number")
+            tspid_n = int(tspid, 10) & 0xff
+        except ValueError:
+            logging.error("exception on conversion of tspid \'%s\' to number", tspid)
             return -1, "Non-numeric tspid (%s)" % tspid
         try:
             tspdata_n = self.otdecoder.parse_val(tspdata) & 0xff
-        except:
-            logging.error("exception on conversion of tspdata \'" + tspdata + "\' to number")
+        except ValueError:
+            logging.error("exception on conversion of tspdata \'%s\' to number", tspdata)
             return -1, "Non-numeric tspdata (%s)" % tspdata
         if self.verbose:
             print("Writing Transparent Slave Parameter (TSP) %d with %d..." % (tspid_n, tspdata_n))
@@ -1540,11 +1757,11 @@ class OTControl:
         rn = 1
         while rn <= retries:
             if rn != 1:
-                eprint("Retrying...")
+                sys.stderr.write("Retrying...\n")
             rn += 1
             r = self.cmd_processor.send_cmd_verbose(NCMD_WRITE, 11, prm)
             if r[0] < 0:
-                eprint("Write of TSP id %d failed: %s" %(tspid_n, r[1]))
+                sys.stderr.write("Write of TSP id %d failed: %s\n" % (tspid_n, r[1]))
                 if r[0] == -1 and (r[2] == OT_UNKNOWN_DATA_ID or r[2] == OT_DATA_INVALID):
                     return -r[2], "Opentherm error " + self.otdecoder.msg_descr(r[2])
                 elif r[0] < -5:
@@ -1562,21 +1779,25 @@ class OTControl:
                 return 1, "Ok"
         return -2, "TSP Writing error"
 
+    # numeric read prm for data-ids with specific data-values (see specPrm)
+    def spec_prm_table(self):
+        return { int(did): self.otdecoder.parse_val(prm) for did, prm in self.specPrm.items() }
+
     def scan(self):
         print("Scanning all known readable data-id of \'" + self.cmd_processor.get_device_id() + "\' device")
+        prm_table = self.spec_prm_table()
         skipId11 = False
-        for di in self.otdecoder.otd:
-            if len(di) == 3 and "R" in self.otdecoder.otd[di].t_dir:
-                if int(di) == 11 and skipId11:
-                    logging.debug("skipping reg 11 as far as read_tsp was done");
-                    continue
-                r = self.read(di, True)
-                if (int(di) == 10) and (r[0] == 1): 
-                    logging.debug("Apparently TSP regs could be read" )
-                    skipId11 = True
-                    self.read_tsp("-1")
-                elif r[0] < -5:
-                    return r[0], r[1]
+        for di_n in self.readable_dataids:
+            if di_n == 11 and skipId11:
+                logging.debug("skipping reg 11 as far as read_tsp was done");
+                continue
+            r = self.read_dataid(di_n, prm_table.get(di_n, 0), True)
+            if (di_n == 10) and (r[0] == 1): 
+                logging.debug("Apparently TSP regs could be read" )
+                skipId11 = True
+                self.read_tsp("-1")
+            elif r[0] < -5:
+                return r[0], r[1]
         return 1, "Ok"
 
 
@@ -1591,19 +1812,20 @@ class OTControl:
             start_id = id_range
             finish_id = "255"
         try:
-            start_id_n = int(start_id) & 0xff
-        except:
-            logging.error("exception on conversion of start_id \'" + start_id + "\' to number")
+            start_id_n = int(start_id, 10) & 0xff
+        except ValueError:
+            logging.error("exception on conversion of start_id \'%s\' to number", start_id)
             return -1, "Non-numeric start_id (%s)" % start_id
         try:
-            finish_id_n = int(finish_id) & 0xff
-        except:
-            logging.error("exception on conversion of finish_id \'" + finish_id + "\' to number")
+            finish_id_n = int(finish_id, 10) & 0xff
+        except ValueError:
+            logging.error("exception on conversion of finish_id \'%s\' to number", finish_id)
             return -1, "Non-numeric finish_id (%s)" % finish_id
 
         print("Full scanning  of \'" + self.cmd_processor.get_device_id() + "\' device for data-id in range " + str(start_id_n) + ".." + str(finish_id_n))
+        prm_table = self.spec_prm_table()
         for di in range(start_id_n, finish_id_n + 1, 1):
-            r = self.read(str(di), True)
+            r = self.read_dataid(di, prm_table.get(di, 0), True)
             if r[0] < -5:
                 return r[0], r[1]
         return 1, "Ok"
@@ -1615,7 +1837,9 @@ class OTControl:
         while True:
             try:
                 cmdline = input("Enter command (h for help)> ")
-                cmd = re.findall(r'\S+', cmdline)
+                cmd = cmdline.split()
+                if not cmd: # empty line
+                    continue
                 if cmd[0] == "scan" or cmd[0] == "s":
                     print("Performing read scan through known Data-Ids...");
                     self.scan(True);
@@ -1645,15 +1869,7 @@ class OTControl:
                     self.read_err(cmd[1] if len(cmd) > 1 and cmd[1][0].isdigit() else "", True)
                     continue
                 elif cmd[0] == "help" or cmd[0] == "h":
-                    print("Commands supported:")
-                    print(" s[can] - scan all known readable opentherm data-id")
-                    print(" f[ullscan] [<startId>[-<lastId>]] - perform unconditional read scan")
-                    print(" r[ead] [<id>[/<data>]] - read data-id")
-                    print(" w[rite] <id> <data> - write data-id with given data")
-                    print(" readtsp/rt [<startTSP>[-<finishTSP>]] - read Transparent Slave Parameter")
-                    print(" writetsp/wt <id> <data> - write Transparent Slave Parameter")
-                    print(" readerr/re [<startFHB>[-<finishFHB>]] - read Fault-History-Buffer entry")
-                    print(" quit")
+                    sys.stdout.write(HELP_TEXT)
                     continue
                 elif cmd[0] == "quit" or cmd[0] == "q":
                     print("Quitting");
@@ -1669,7 +1885,37 @@ class OTControl:
 
 
 
+# command line commands taking arguments: method of OTControl and error messages for each missing argument
+CMD_DISPATCH = {
+    "read": ("read", ("No dataid to read",)),
+    "write": ("write", ("No dataid to write", "No data value to write")),
+    "readtsp": ("read_tsp", ("No tspid to read",)),
+    "writetsp": ("write_tsp", ("No tspid to write", "No tsp data to write")),
+    "readerr": ("read_err", ("No error idx to read",)),
+}
+CMD_DISPATCH.update({ "r": CMD_DISPATCH["read"], "w": CMD_DISPATCH["write"], "rt": CMD_DISPATCH["readtsp"],
+                      "wt": CMD_DISPATCH["writetsp"], "re": CMD_DISPATCH["readerr"] })
+
+# split command line into list of (OTControl method, arguments); returns the list and error text (None if ok)
+def parse_cmd_list(cmd):
+    commands = []
+    argI = 0
+    argN = len(cmd)
+    while argI < argN:
+        entry = CMD_DISPATCH.get(cmd[argI])
+        if entry is None:
+            return commands, "Unknown command \'" + cmd[argI] + "\'"
+        method, missing = entry
+        cmdargs = cmd[argI + 1:argI + 1 + len(missing)]
+        if len(cmdargs) < len(missing):
+            return commands, missing[len(cmdargs)]
+        commands.append((method, cmdargs))
+        argI = argI + 1 + len(missing)
+    return commands, None
+
 if __name__ == "__main__":
+    import argparse # only the command line front-end needs it
+
     parser = argparse.ArgumentParser(description="Nevoton opentherm module control via MQTT (with option -t) or Serial/ModBus (with option -m) interface", add_help=False)
     parser.add_argument("-t", "--topic", dest="mqtt_device", type=str, help="Nevoton module id as MQTT topic", default="") # wbe2-i-opentherm_11
     parser.add_argument("-h", "--host", dest="host", type=str, help="MQTT host", default="localhost")
@@ -1703,7 +1949,7 @@ if __name__ == "__main__":
         args.retries = 1
 
     if verbose:
-        print("Nevoton OpenTherm Explorer utility for Wirenboard. Ver 0.%s beta (C) 2024 MaxWolf" % "$Revision: 410 $".split(' ')[1]);
+        print("Nevoton OpenTherm Explorer utility for Wirenboard. Ver %s beta (C) 2024 MaxWolf" % __version__);
 
     h = []
     if args.logfileName != "":
@@ -1714,101 +1960,80 @@ if __name__ == "__main__":
         h.append(logging. SysLogHandler())
 
     logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO, format='%(asctime)s %(levelname)s %(message)s', handlers = h)
+    # the log format uses none of thread/process/caller info, do not collect it for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
 
     logging.info('===== Starting NOTExplorer')
-    logging.debug('there will be %d retries on each exchange' % args.retries);
+    logging.debug('there will be %d retries on each exchange', args.retries);
+
+    # the whole command list is checked before any exchange with the device
+    commands = []
+    if not args.cmd:
+        eprint("Error! No command")
+        logging.error("Invalid command line: no command")
+        sys.exit(1)
+    if args.cmd[0] not in ("scan", "s", "fullscan", "f", "cmd", "c"):
+        commands, ex = parse_cmd_list(args.cmd)
+        if ex is not None:
+            eprint("Error! " + ex)
+            logging.error("Invalid command line: %s", ex)
+            sys.exit(1)
+
+    result = (-1, "UNDEF")
     try:
-        ot_decoder = OTDecoder()
+        with contextlib.ExitStack() as stack:
+            ot_decoder = OTDecoder()
 
-        try:
-            if args.mqtt_device != "":
-                ot_interface = OTMQTTInterfaсe(args.host, args.port, args.username, args.password, args.mqtt_device, verbose, ot_decoder)
-            elif args.modbus_device != "":
-                ot_interface = OTSerialInterfaсe(args.modbus_device, args.addr, verbose, ot_decoder)
-                if args.debug:
-                    log = logging.getLogger('pymodbus')
-                    log.setLevel(logging.INFO) # use logging.DEBUG to reveal intimate modbus exchanges
-            else:
-                eprint("Either -t or -m (or --help) option should be specified")
-                logging.error("Neither MQTT nor Serial device specified")
+            try:
+                if args.mqtt_device != "":
+                    ot_interface = OTMQTTInterfaсe(args.host, args.port, args.username, args.password, args.mqtt_device, verbose, ot_decoder)
+                elif args.modbus_device != "":
+                    ot_interface = OTSerialInterfaсe(args.modbus_device, args.addr, verbose, ot_decoder)
+                    if args.debug:
+                        log = logging.getLogger('pymodbus')
+                        log.setLevel(logging.INFO) # use logging.DEBUG to reveal intimate modbus exchanges
+                else:
+                    eprint("Either -t or -m (or --help) option should be specified")
+                    logging.error("Neither MQTT nor Serial device specified")
+                    sys.exit(1)
+            except Exception as e:
+                ot_interface = None
+                print("Error creating opentherm communitcation")
                 sys.exit(1)
-        except Exception as e:
-            ot_interface = None
-            print("Error creating opentherm communitcation")
-            sys.exit(1)
 
-        otc = OTControl(ot_interface, ot_decoder, verbose, args.retries)
+            stack.enter_context(ot_interface)
+            otc = OTControl(ot_interface, ot_decoder, verbose, args.retries)
 
-        logging.info("Started with command: [%s/%s/%s]" % (
-            args.cmd[0] if len(args.cmd) >= 1 else "", 
-            args.cmd[1] if len(args.cmd) >= 2 else "", 
-            args.cmd[2] if len(args.cmd) >= 3 else ""))
+            logging.info("Started with command: [%s/%s/%s]",
+                args.cmd[0] if len(args.cmd) >= 1 else "", 
+                args.cmd[1] if len(args.cmd) >= 2 else "", 
+                args.cmd[2] if len(args.cmd) >= 3 else "")
 
-        if otc.connect()[0] < 0:
-            ex = "Unable to connect: %s" % otc.connect()[1]
-            eprint(ex)
-            logging.error(ex)
-            sys.exit(1)
+            r = otc.connect()
+            if r[0] < 0:
+                ex = "Unable to connect: %s" % r[1]
+                eprint(ex)
+                logging.error(ex)
+                sys.exit(1)
 
-        result = (-1, "UNDEF")
-        if args.cmd[0] == "scan" or args.cmd[0] == "s":
-            result = otc.scan()
-        elif args.cmd[0] == "fullscan" or args.cmd[0] == "f":
-            result = otc.full_scan(args.cmd[1] if len(args.cmd) > 1 and args.cmd[1][0].isdigit() else "")
-        elif args.cmd[0] == "cmd" or args.cmd[0] == "c":
-            result = otc.interactive_cmd()
-        else:
-            argI = 0
-            argN = len(args.cmd)
-            while argI < argN:
-                if args.cmd[argI] == "read" or args.cmd[argI] == "r":
-                    if argI + 1 >= argN:
-                        result = ( -1, "No dataid to read" )
-                    else:
-                        result = otc.read(args.cmd[argI+1])
-                    argI = argI + 2
-                elif args.cmd[argI] == "write" or args.cmd[argI] == "w":
-                    if argI + 1 >= argN:
-                        result = ( -1, "No dataid to write" )
-                    else:
-                        if argI + 2 >= argN:
-                            result = ( -1, "No dataid to write" )
-                        else:
-                            result = otc.write(args.cmd[argI+1], args.cmd[argI+2])
-                    argI = argI + 3
-                elif args.cmd[argI] == "readtsp" or args.cmd[argI] == "rt":
-                    if argI + 1 >= argN:
-                        result = ( -1, "No tspid to read" )
-                    else:
-                        result = otc.read_tsp(args.cmd[argI+1])
-                    argI = argI + 2
-                elif args.cmd[argI] == "writetsp" or args.cmd[argI] == "wt":
-                    if argI + 1 >= argN:
-                        result = ( -1, "No tspid to write" )
-                    else:
-                        if argI + 2 >= argN:
-                            result = ( -1, "No tsp data to write" )
-                        else:
-                            result = otc.write_tsp(args.cmd[argI+1], args.cmd[argI+2])
-                    argI = argI + 3
-                elif args.cmd[argI] == "readerr" or args.cmd[argI] == "re":
-                    if argI + 1 >= argN:
-                        result = ( -1, "No error idx to read" )
-                    else:
-                        result = otc.read_err(args.cmd[argI+1])
-                    argI = argI + 2
-                else:
-                    result = (-1, "Unknown command \'" + args.cmd[argI] + "\'")
-                    break
+            if args.cmd[0] == "scan" or args.cmd[0] == "s":
+                result = otc.scan()
+            elif args.cmd[0] == "fullscan" or args.cmd[0] == "f":
+                result = otc.full_scan(args.cmd[1] if len(args.cmd) > 1 and args.cmd[1][0].isdigit() else "")
+            elif args.cmd[0] == "cmd" or args.cmd[0] == "c":
+                result = otc.interactive_cmd()
+            else:
+                for method, cmdargs in commands:
+                    result = getattr(otc, method)(*cmdargs)
     except KeyboardInterrupt:
         result = (-1, "Keyboard interrupt")
 
-    del otc
-    del ot_interface
-    del ot_decoder
     if result[0] < 0:
         eprint("Error! " + result[1])
-        logging.info("Returning exit code %d" % -result[0])
+        logging.info("Returning exit code %d", -result[0])
         sys.exit(-result[0])
     else:
         logging.info("Returning success (exit code 0)")